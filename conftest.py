@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from tools import UniversalCompanyScraper
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run each test in its own temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def scraper(tmp_path_factory):
+    """Scraper shared by the tests in a module, writing its files into a
+    temporary directory"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("scraper"))
+        s = UniversalCompanyScraper("https://example.com")
+        yield s
+        s.close()
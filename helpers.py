@@ -153,6 +153,29 @@ class Helpers:
         "#business-name",
     ]
 
+    # Company-specific name selectors that mark a detail page as rendered;
+    # unlike name_selectors there are no meta tags, bare headings or title
+    # classes, which a client-rendered page shell already contains
+    ready_selectors = [
+        ".exhibitor__bar-name",
+        ".exhibitor__name",
+        ".company-name",
+        ".company-title",
+        ".exhibitor-name",
+        ".brand-name",
+        ".business-name",
+        ".vendor-name",
+        '[class*="company-name"]',
+        '[class*="company_name"]',
+        '[class*="business-name"]',
+        '[class*="business_name"]',
+        ".profile-name",
+        ".org-name",
+        ".merchant-name",
+        "#company-name",
+        "#business-name",
+    ]
+
     logo_selectors = [
         'img[alt*="logo" i]',
         'img[src*="logo" i]',
@@ -285,6 +308,17 @@ class Helpers:
         '[property="og:url"]',
     ]
 
+    # Selector lists read in one page.evaluate call per company page
+    selector_bundle = {
+        "name": name_selectors,
+        "logo": logo_selectors,
+        "description": description_selectors,
+        "phone": phone_selectors,
+        "email": email_selectors,
+        "contact": contact_selectors,
+        "website": website_selectors,
+    }
+
     social_container_selectors = [
         ".social-links",
         ".social-media",
@@ -409,10 +443,101 @@ class Helpers:
         ".entry",
     ]
 
-    scroll_methods = [
-        "window.scrollTo(0, document.body.scrollHeight)",
-        "window.scrollBy(0, window.innerHeight * 3)",
-        "document.documentElement.scrollTop = document.documentElement.scrollHeight",
+    clickable_item_selectors = [
+        ".company-item",
+        ".exhibitor-item",
+        ".vendor-item",
+        ".supplier-item",
+        ".company-card",
+        ".exhibitor-card",
+        ".list-item",
+        ".grid-item",
+        ".result-item",
+        ".listing-item",
+        '[class*="company"]',
+        '[class*="exhibitor"]',
+        '[class*="item"]',
+        '[class*="card"]',
+        "article",
+        ".entry",
+        ".result",
+    ]
+
+    modal_selectors = [
+        '[role="dialog"]',
+        '[aria-modal="true"]',
+        ".modal",
+        '[class*="modal"]',
+        '[class*="popup"]',
+    ]
+
+    # Analytics, ad and session-recording hosts; their scripts and beacons
+    # never affect the company data
+    tracker_domains = [
+        "google-analytics.com",
+        "googletagmanager.com",
+        "googleadservices.com",
+        "googlesyndication.com",
+        "doubleclick.net",
+        "connect.facebook.net",
+        "analytics.tiktok.com",
+        "snap.licdn.com",
+        "static.ads-twitter.com",
+        "bat.bing.com",
+        "clarity.ms",
+        "hotjar.com",
+        "mouseflow.com",
+        "fullstory.com",
+        "segment.com",
+        "mixpanel.com",
+        "amplitude.com",
+        "newrelic.com",
+        "nr-data.net",
+        "criteo.com",
+        "taboola.com",
+        "outbrain.com",
+        "yandex.ru/metrika",
+        "mc.yandex.ru",
+    ]
+
+    # Cookie/consent banner containers; attributes match in any case, as
+    # in "CybotCookiebotDialog"
+    cookie_container = (
+        ':is([class*="cookie" i], [id*="cookie" i], '
+        '[class*="consent" i], [id*="consent" i])'
+    )
+
+    # In order of preference. Inside a cookie/consent container any
+    # button with an accept/agree/allow word matches ("I accept", "Accept
+    # & close"); elsewhere only the exact labels do, so buttons like "Book
+    # a stand" or "Outlook" never match.
+    cookie_selectors = [
+        cookie_container + " button:text-matches("
+        '"(^|[^a-z])(accept|agree|allow)", "i")',
+        cookie_container
+        + ' button:text-matches("^ *(ok|okay|got it) *$", "i")',
+        'button:text-matches("^ *(accept|agree|i agree|allow)'
+        '( all)?( cookies)? *$", "i")',
+    ]
+
+    # Any button of a cookie/consent container; only clicked when it is
+    # the banner's single visible button
+    cookie_fallback_selectors = [
+        '[class*="cookie"] button',
+        '[id*="cookie"] button',
+        '[class*="consent"] button',
+        '[id*="consent"] button',
+    ]
+
+    close_selectors = [
+        'button[aria-label="Close"]',
+        "button:has(.close)",
+        ".close-button",
+        ".close",
+        '[class*="close"]',
+        "button.modal-close",
+        ".overlay-close",
+        ".dialog-close",
     ]
 
     load_more_selectors = [
@@ -1,33 +1,48 @@
 import asyncio
-from asyncio.log import logger
+import logging
+import sys
 from tools import UniversalCompanyScraper
 
+logger = logging.getLogger(__name__)
 
-async def main(url: str = '', headless: bool = False, timeout: int = 30000):
+
+async def run_scraper(
+    url: str,
+    headless: bool = False,
+    timeout: int = 10000,
+    max_concurrency: int = 5,
+):
     """
-    Main function to run the universal scraper
+    Run the universal scraper for one URL on the current event loop
+    
+    The shared browser pool is left running so several scrapes can be
+    awaited together (e.g. with asyncio.gather) and reuse it; call
+    UniversalCompanyScraper.shutdown_pool() when done.
     
     Args:
         url: URL of the website to scrape (required)
         headless: Whether to run browser in headless mode
         timeout: Timeout for page operations in milliseconds
+        max_concurrency: Maximum number of company pages scraped at once
+    
+    Raises:
+        ValueError: If no URL is given
     """
     if not url:
-        print("Error: URL is required!")
-        print("Usage: await main('https://example.com/companies')")
-        return
+        raise ValueError("url is required")
     
-    print(f"\n{'='*60}")
-    print(f"Starting Universal Company Scraper")
-    print(f"Target URL: {url}")
-    print(f"Mode: {'Headless' if headless else 'Visible'}")
-    print(f"{'='*60}\n")
+    sys.stdout.write(
+        f"\n{'='*60}\nStarting Universal Company Scraper\n"
+        f"Target URL: {url}\nMode: {'Headless' if headless else 'Visible'}\n"
+        f"{'='*60}\n\n"
+    )
     
     # Initialize scraper
     scraper = UniversalCompanyScraper(
         base_url=url,
         headless=headless,
-        timeout=timeout
+        timeout=timeout,
+        max_concurrency=max_concurrency
     )
     
     try:
@@ -46,11 +61,43 @@ async def main(url: str = '', headless: bool = False, timeout: int = 30000):
         logger.error(f"Error in main execution: {str(e)}")
         return []
 
+    finally:
+        scraper.close()
+
+
+async def main(
+    url: str = '',
+    headless: bool = False,
+    timeout: int = 10000,
+    max_concurrency: int = 5,
+):
+    """
+    Main function to run the universal scraper
+    
+    Runs run_scraper() and shuts the browser pool down afterwards.
+    
+    Args:
+        url: URL of the website to scrape (required)
+        headless: Whether to run browser in headless mode
+        timeout: Timeout for page operations in milliseconds
+        max_concurrency: Maximum number of company pages scraped at once
+    
+    Raises:
+        ValueError: If no URL is given
+    """
+    try:
+        return await run_scraper(
+            url,
+            headless=headless,
+            timeout=timeout,
+            max_concurrency=max_concurrency
+        )
+    finally:
+        await UniversalCompanyScraper.shutdown_pool()
+
 
 if __name__ == "__main__":
     # Example usage with different websites
-    import sys
-    
     # Get URL from command line argument if provided
     if len(sys.argv) > 1:
         target_url = sys.argv[1]
@@ -59,9 +106,22 @@ if __name__ == "__main__":
         target_url = "https://hiltonmexicocity.expofp.com/"
         print(f"No URL provided, using: {target_url}")
     
+    # Use uvloop's faster event loop when available (not on Windows);
+    # uvloop.run replaces the deprecated uvloop.install() since 0.18
+    try:
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+    
     # Run the scraper
-    asyncio.run(main(
-        url=target_url,
-        headless=True,  # Set to True for production
-        timeout=30000
-    ))
\ No newline at end of file
+    try:
+        run(main(
+            url=target_url,
+            headless=True,  # Set to True for production
+            timeout=10000,
+            max_concurrency=5
+        ))
+    except ValueError as e:
+        print(f"Error: {e}")
+        print("Usage: python main.py https://example.com/companies")
+        sys.exit(1)
\ No newline at end of file
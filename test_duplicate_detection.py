@@ -3,17 +3,14 @@
 Test script to verify duplicate detection by source_url
 """
 
-import json
-from tools import UniversalCompanyScraper
+import pytest
 
-def test_duplicate_detection():
+
+def test_duplicate_detection(scraper):
     """Test the source_url based duplicate detection"""
     
     print("Testing duplicate detection by source_url...")
     
-    # Create a test scraper instance
-    scraper = UniversalCompanyScraper("https://example.com")
-    
     # Test data - companies with different URLs
     test_companies = [
         {
@@ -48,18 +45,19 @@ def test_duplicate_detection():
         }
     ]
     
-    print("\n--- Testing company save and duplicate detection ---")
+    # Collect output per section and write it once
+    log = ["\n--- Testing company save and duplicate detection ---"]
     
     saved_count = 0
     skipped_count = 0
     
     for i, company in enumerate(test_companies, 1):
-        print(f"\nTesting company {i}: {company['name']}")
-        print(f"Source URL: {company['source_url']}")
+        log.append(f"\nTesting company {i}: {company['name']}")
+        log.append(f"Source URL: {company['source_url']}")
         
         # Check if URL is already processed before saving
         if scraper.is_source_url_processed(company['source_url']):
-            print(f"❌ URL already processed (pre-check): {company['source_url']}")
+            log.append(f"❌ URL already processed (pre-check): {company['source_url']}")
             skipped_count += 1
             continue
             
@@ -67,24 +65,34 @@ def test_duplicate_detection():
         was_saved = scraper._save_company_immediately(company)
         
         if was_saved:
-            print(f"✅ Company saved successfully")
+            log.append(f"✅ Company saved successfully")
             saved_count += 1
         else:
-            print(f"❌ Company skipped as duplicate") 
+            log.append(f"❌ Company skipped as duplicate") 
             skipped_count += 1
     
-    print(f"\n--- Results ---")
-    print(f"Companies saved: {saved_count}")
-    print(f"Companies skipped as duplicates: {skipped_count}")
-    print(f"Total companies in scraper: {len(scraper.companies_data)}")
+    print("\n".join(log))
+    log.clear()
+    
+    print(
+        f"\n--- Results ---\n"
+        f"Companies saved: {saved_count}\n"
+        f"Companies skipped as duplicates: {skipped_count}\n"
+        f"Total companies in scraper: {len(scraper.companies_data)}"
+    )
+    assert saved_count == 2
+    assert skipped_count == 3
+    assert len(scraper.companies_data) == 2
     
     # Show the saved companies
-    print(f"\n--- Saved Companies ---")
+    log.append(f"\n--- Saved Companies ---")
     for i, company in enumerate(scraper.companies_data, 1):
-        print(f"{i}. {company.get('name', 'Unknown')} - {company.get('source_url', 'No URL')}")
+        log.append(f"{i}. {company.get('name', 'Unknown')} - {company.get('source_url', 'No URL')}")
+    print("\n".join(log))
+    log.clear()
     
     # Test the pre-check method
-    print(f"\n--- Testing pre-check method ---")
+    log.append(f"\n--- Testing pre-check method ---")
     test_urls = [
         "https://example.com/company1",
         "https://example.com/company1?different=param",
@@ -93,20 +101,14 @@ def test_duplicate_detection():
         "https://example.com/company3"  # This one shouldn't exist
     ]
     
-    for url in test_urls:
-        is_processed = scraper.is_source_url_processed(url)
+    results = scraper.are_source_urls_processed(test_urls)
+    assert results == [True, True, True, True, False]
+    for url, is_processed in zip(test_urls, results):
         status = "✅ Already processed" if is_processed else "❌ Not processed"
-        print(f"{status}: {url}")
+        log.append(f"{status}: {url}")
+    print("\n".join(log))
+    log.clear()
     
-    # Clean up test files
-    try:
-        import os
-        os.remove(scraper.csv_filename)
-        os.remove(scraper.json_filename)
-        print(f"\n--- Cleanup ---")
-        print("Test files cleaned up successfully")
-    except:
-        print("Note: Could not clean up test files")
 
 if __name__ == "__main__":
-    test_duplicate_detection()
+    raise SystemExit(pytest.main([__file__, "-s"]))
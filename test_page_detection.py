@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for deciding when a company page is ready to be extracted
+"""
+
+from bs4 import BeautifulSoup
+import pytest
+
+from tools import UniversalCompanyScraper
+
+
+# Client-rendered page before its bundle ran: site chrome only
+SPA_SHELL = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Expo 2025 - Exhibitors</title>
+    <meta property="og:title" content="Expo 2025">
+    <meta itemprop="name" content="Expo 2025">
+</head>
+<body>
+    <header>
+        <h1 class="site-title">Expo 2025</h1>
+        <h2 class="page-heading">Exhibitor details</h2>
+    </header>
+    <div id="root"></div>
+    <script src="/static/js/main.3f2a1c.js"></script>
+</body>
+</html>"""
+
+# The same page once the company content is rendered
+RENDERED_PAGE = SPA_SHELL.replace(
+    '<div id="root"></div>',
+    '<div id="root"><div class="exhibitor__name">Acme Corp</div></div>',
+)
+
+
+def test_default_ready_selector_ignores_spa_shell(scraper):
+    """The default readiness selector must not match an empty page shell"""
+    soup = BeautifulSoup(SPA_SHELL, "html.parser")
+    assert soup.select(scraper.primary_selector) == []
+
+
+def test_default_ready_selector_matches_company_content(scraper):
+    """The default readiness selector matches the rendered company name"""
+    soup = BeautifulSoup(RENDERED_PAGE, "html.parser")
+    assert [e.get_text() for e in soup.select(scraper.primary_selector)] == [
+        "Acme Corp"
+    ]
+
+
+def test_static_shell_is_not_accepted(scraper):
+    """Static HTML with only site chrome must fall back to the browser"""
+    assert UniversalCompanyScraper._looks_rendered(SPA_SHELL)
+    soup = BeautifulSoup(SPA_SHELL, "html.parser")
+    assert not scraper._has_company_content(soup)
+    soup = BeautifulSoup(RENDERED_PAGE, "html.parser")
+    assert scraper._has_company_content(soup)
+
+
+def test_browser_only_ready_selector_skips_static_path(scraper, monkeypatch):
+    """A primary selector without plain CSS never accepts static HTML"""
+    monkeypatch.setattr(
+        scraper,
+        "_static_ready_css",
+        scraper._css_only('div:has-text("Acme")'),
+    )
+    soup = BeautifulSoup(RENDERED_PAGE, "html.parser")
+    assert not scraper._has_company_content(soup)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
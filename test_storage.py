@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the NDJSON company store surviving a scraper restart
+"""
+
+import csv
+import json
+
+import pytest
+
+import tools
+from tools import UniversalCompanyScraper
+
+
+BASE_URL = "https://example.com"
+
+COMPANIES = [
+    {
+        "name": "Acme Corp",
+        "source_url": "https://example.com/company/1",
+        "website_url": "https://acme.com",
+        "description": "Anvils – and more ✓",
+    },
+    {
+        "name": "Globex",
+        "source_url": "https://example.com/company/2",
+        "website_url": "https://globex.com",
+        "socials": [
+            "https://linkedin.com/company/globex",
+            "https://x.com/globex",
+            "https://www.youtube.com/@globex",
+        ],
+    },
+]
+
+
+def restart(scraper):
+    """Close a scraper and open a new one on the same files"""
+    scraper.close()
+    return UniversalCompanyScraper(BASE_URL)
+
+
+def save_restart_export():
+    """Save, restart and export; returns the reopened scraper"""
+    s = UniversalCompanyScraper(BASE_URL)
+    for company in COMPANIES:
+        assert s._save_company_immediately(dict(company))
+    s = restart(s)
+
+    assert s._company_count == 2
+    assert s.is_source_url_processed("https://example.com/company/1/")
+    # Already saved before the restart, by source URL and by key
+    assert not s._save_company_immediately(dict(COMPANIES[0]))
+    assert not s._save_company_immediately(
+        {**COMPANIES[1], "source_url": "https://example.com/globex"}
+    )
+    assert s._save_company_immediately(
+        {"name": "Initech", "source_url": "https://example.com/company/3"}
+    )
+    assert s._company_count == 3
+
+    s._finalize()
+    s.close()
+    return s
+
+
+def test_resume_after_restart(workdir):
+    """Count, duplicate checks and indexes continue from the saved store"""
+    s = save_restart_export()
+
+    companies = list(s.iter_companies())
+    assert [c["name"] for c in companies] == ["Acme Corp", "Globex", "Initech"]
+    assert [c["company_index"] for c in companies] == [1, 2, 3]
+    assert [c["name"] for c in s.iter_companies(start=2)] == ["Initech"]
+
+    with open(s.json_filename, encoding="utf-8") as f:
+        assert json.load(f) == companies
+
+    with open(s.csv_filename, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+    assert reader.fieldnames == tools.CSV_FIELDNAMES
+    assert [row["name"] for row in rows] == ["Acme Corp", "Globex", "Initech"]
+    assert rows[1]["linkedin"] == "https://linkedin.com/company/globex"
+    assert rows[1]["twitter"] == "https://x.com/globex"
+    assert rows[1]["other_socials"] == "https://www.youtube.com/@globex"
+    assert rows[1]["facebook"] == rows[0]["linkedin"] == ""
+
+
+def test_stdlib_json_fallback(workdir, monkeypatch):
+    """The store round-trips the same way without orjson installed"""
+    monkeypatch.setattr(tools, "orjson", None)
+    monkeypatch.setattr(tools, "json", json, raising=False)
+
+    s = save_restart_export()
+
+    with open(s.json_filename, encoding="utf-8") as f:
+        assert json.load(f) == list(s.iter_companies())
+    with open(s.jsonl_filename, encoding="utf-8") as f:
+        assert "Anvils – and more ✓" in f.read()
+
+
+def test_legacy_json_array_is_migrated(workdir):
+    """A JSON array from older versions is converted to the NDJSON store"""
+    s = UniversalCompanyScraper(BASE_URL)
+    s.close()
+    with open(s.json_filename, "w", encoding="utf-8") as f:
+        json.dump(COMPANIES, f)
+
+    s = UniversalCompanyScraper(BASE_URL)
+    try:
+        assert s._company_count == 2
+        assert list(s.iter_companies()) == COMPANIES
+        assert not s._save_company_immediately(dict(COMPANIES[1]))
+    finally:
+        s.close()
+
+
+def test_write_json_of_empty_store(workdir):
+    """Exporting an empty store writes an empty array"""
+    s = UniversalCompanyScraper(BASE_URL)
+    s._write_json("out.json")
+    s.close()
+    with open("out.json", encoding="utf-8") as f:
+        assert json.load(f) == []
+
+
+def test_company_key_prefers_website(workdir):
+    """The same company found on two pages is saved once"""
+    s = UniversalCompanyScraper(BASE_URL)
+    try:
+        assert s._save_company_immediately(dict(COMPANIES[0]))
+        # Same name and website on another page
+        assert not s._save_company_immediately(
+            {**COMPANIES[0], "source_url": "https://example.com/acme"}
+        )
+        # Same name, different website
+        assert s._save_company_immediately(
+            {
+                **COMPANIES[0],
+                "source_url": "https://example.com/acme-uk",
+                "website_url": "https://acme.co.uk/",
+            }
+        )
+        # Without a website the source page identifies the company
+        assert s._save_company_immediately(
+            {"name": "Acme Corp", "source_url": "https://example.com/acme-2"}
+        )
+        assert s._company_count == 3
+    finally:
+        s.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-s"]))
@@ -1,19 +1,53 @@
 import asyncio
-import json
+import collections
+import functools
+import hashlib
+import itertools
+import operator
 import re
+import shutil
 import csv
-from typing import List, Dict, Optional, Set, Tuple
-from urllib.parse import urlparse, urljoin
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse, urljoin, urlsplit
 from playwright.async_api import (
     async_playwright,
     Page,
     Browser,
     BrowserContext,
+    ElementHandle,
+    Playwright,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
 )
+from bs4 import BeautifulSoup
+import soupsieve
 import logging
 import time
 from pathlib import Path
 
+try:
+    import httpx
+except ImportError:  # Static-page fast path is optional
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # Slower standard library encoder as a fallback
+    import json
+
+    orjson = None
+
 from helpers import helpers
 
 # Configure logging
@@ -22,10 +56,322 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Warm browser pool shared by all scrapers in the process
+_PLAYWRIGHT: Optional[Playwright] = None
+_BROWSER: Optional[Browser] = None
+_CTX_POOL: Optional["asyncio.Queue[BrowserContext]"] = None
+_POOL_LOCK = asyncio.Lock()
+
+# Number of times each pooled context has been borrowed since it was created
+_CTX_USES: Dict[BrowserContext, int] = {}
+
+# Resource types aborted by pooled contexts unless a scraper overrides them.
+# Stylesheets stay enabled because visibility checks and clicks depend on
+# layout, and websockets because some listings stream their data.
+DEFAULT_BLOCK_RESOURCES = frozenset(
+    {"image", "font", "media", "texttrack", "manifest"}
+)
+
+# Resource types each pooled context aborts, bound to the block_resources
+# of the scraper currently borrowing it
+_CTX_BLOCK: Dict[BrowserContext, Set[str]] = {}
+
+# Pooled contexts currently borrowed by a scraper with block_trackers on
+_CTX_BLOCK_TRACKERS: Set[BrowserContext] = set()
+
+# Requests to tracker hosts (or their subdomains), aborted whatever their
+# resource type when a scraper opts in with block_trackers
+_TRACKER_RE = re.compile(
+    r"^[a-z]+://(?:[^/?#]*\.)?(?:"
+    + "|".join(map(re.escape, helpers.tracker_domains))
+    + r")(?:[:/?#]|$)",
+    re.I,
+)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Returned by the static fetch when the site answers HTTP 429, so the
+# page counts as failed instead of being retried in a browser
+_RATE_LIMITED = object()
+
+# Matches inline and external <script> blocks in raw HTML
+_SCRIPT_RE = re.compile(r"<script\b.*?</script>", re.IGNORECASE | re.DOTALL)
+
+# Reads one matched element for a helpers.selector_bundle field
+_READ_ELEMENT_JS = """(element, field, selector) => {
+    switch (field) {
+        case "logo":
+            return element.getAttribute("src");
+        case "description":
+            return selector.startsWith("meta")
+                ? element.getAttribute("content")
+                : element.innerText;
+        case "phone":
+        case "email":
+            return {
+                href: element.getAttribute("href"),
+                text: element.innerText,
+            };
+        case "website":
+            return element.getAttribute("href");
+        default:
+            return element.innerText;
+    }
+}"""
+
+# Evaluates every selector of helpers.selector_bundle in a single round-trip.
+# Each selector maps to a list of read values (every match for "website",
+# the first one otherwise), or null if the selector uses Playwright-only
+# syntax that querySelectorAll rejects.
+_EXTRACT_JS = (
+    """(bundle) => {
+    const read = """
+    + _READ_ELEMENT_JS
+    + """;
+    const result = {title: document.title};
+    for (const [field, selectors] of Object.entries(bundle)) {
+        const limit = field === "website" ? undefined : 1;
+        result[field] = selectors.map((selector) => {
+            let elements;
+            try {
+                elements = document.querySelectorAll(selector);
+            } catch (e) {
+                return null;
+            }
+            return Array.from(elements)
+                .slice(0, limit)
+                .map((element) => read(element, field, selector));
+        });
+    }
+    return result;
+}"""
+)
+
+# Same as _EXTRACT_JS for one selector, resolved by a Playwright locator
+_READ_MATCHES_JS = (
+    """(elements, [field, selector]) => {
+    const read = """
+    + _READ_ELEMENT_JS
+    + """;
+    const limit = field === "website" ? undefined : 1;
+    return elements
+        .slice(0, limit)
+        .map((element) => read(element, field, selector));
+}"""
+)
+
+# Number of elements matched by each selector, in one round trip
+_COUNT_MATCHES_JS = """(selectors) => selectors.map((selector) => {
+    try {
+        return document.querySelectorAll(selector).length;
+    } catch (e) {
+        return 0;
+    }
+})"""
+
+# Reads the company fields shown on every listing card in one round trip
+_LISTING_CARDS_JS = """(selector) => Array.from(
+    document.querySelectorAll(selector),
+    (card) => {
+        const text = (element) => (element ? element.innerText.trim() : "");
+        const href = (element) => (element ? element.getAttribute("href") : "");
+        const logo = card.querySelector("img");
+        return {
+            name: text(
+                card.querySelector(
+                    "h1, h2, h3, h4, h5, h6, [class*='name'], [class*='title']"
+                )
+            ),
+            description: text(card.querySelector("[class*='desc'], p")),
+            logo: logo ? logo.getAttribute("src") : "",
+            phone: href(card.querySelector("a[href^='tel:']")),
+            email: href(card.querySelector("a[href^='mailto:']")),
+            links: Array.from(
+                card.querySelectorAll("a[href]"),
+                (link) => link.href
+            ),
+        };
+    }
+)"""
+
+# CSV columns, with social media links split per platform
+CSV_FIELDNAMES = [
+    "company_index",
+    "name",
+    "description",
+    "website_url",
+    "phone",
+    "email",
+    "logo_url",
+    "source_url",
+    "facebook",
+    "instagram",
+    "linkedin",
+    "twitter",
+    "other_socials",
+]
+
+# Picks a row in CSV_FIELDNAMES order out of a merged company dict, with
+# empty strings for the fields a company doesn't have
+_CSV_ROW = operator.itemgetter(*CSV_FIELDNAMES)
+_CSV_DEFAULTS = dict.fromkeys(CSV_FIELDNAMES, "")
+
+# Text patterns compiled once at import; phone patterns stay separate
+# because they are tried in order of preference
+_PHONE_RES = [re.compile(pattern) for pattern in helpers.phone_patterns]
+_EMAIL_RE = re.compile(helpers.email_pattern)
+
+# Translation table deleting everything but digits, "+", "-", whitespace and
+# parentheses from matched phone numbers. The phone patterns only match
+# ASCII digits and punctuation plus whitespace, so Latin-1 covers them.
+_PHONE_STRIP = {
+    code: None
+    for code in range(256)
+    if not re.match(r"[\d\+\-\s\(\)]", chr(code))
+}
+
+# Joins contact section texts; two newlines keep phone patterns, which
+# allow a single separator between digit groups, from spanning sections
+_CONTACT_TEXT_SEPARATOR = "\n\n"
+
+# Navigation/utility links and likely detail pages, one scan per link
+_SKIP_RE = re.compile("|".join(map(re.escape, helpers.skip_patterns)), re.I)
+_DETAIL_RE = re.compile("|".join(helpers.detail_patterns))
+
+# One capture group per platform column, in SOCIAL_PLATFORMS order
+SOCIAL_PLATFORMS = ("facebook", "instagram", "linkedin", "twitter")
+_SOCIAL_BUCKET_RE = re.compile(
+    r"(facebook\.com|fb\.com|fb\.me)"
+    r"|(instagram\.com|instagr\.am)"
+    r"|(linkedin\.com|lnkd\.in)"
+    r"|(twitter\.com|t\.co|x\.com)",
+    re.I,
+)
+
+# Company fields counted in the scraping stats
+STATS_FIELDS = (
+    "name",
+    "description",
+    "website_url",
+    "phone",
+    "email",
+    "logo_url",
+    "socials",
+)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON, with orjson when it is installed
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """
+    Parse JSON, with orjson when it is installed
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _fingerprint(text: str) -> int:
+    """
+    Compute a 64-bit fingerprint of a string for set-based deduplication
+
+    Collisions are possible in theory, but at 64 bits they only become
+    likely around billions of distinct keys, far beyond a single crawl.
+
+    Args:
+        text: String to fingerprint
+
+    Returns:
+        int: Unsigned 64-bit fingerprint
+    """
+    return int.from_bytes(
+        hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+async def _first_success(*coros) -> bool:
+    """
+    Run awaitables concurrently until the first one succeeds
+
+    The others are cancelled as soon as one of them returns, so waits can
+    be raced against each other.
+
+    Args:
+        *coros: Coroutines to race
+
+    Returns:
+        bool: True if any of them completed without raising
+    """
+    pending = {asyncio.ensure_future(coro) for coro in coros}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            if any(task.exception() is None for task in done):
+                return True
+        return False
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _route_request(
+    route: Route, blocked: Set[str], block_trackers: bool = False
+) -> None:
+    """
+    Abort requests for resource types the scraper never reads and,
+    optionally, for tracker hosts
+
+    Args:
+        route: Intercepted Playwright route
+        blocked: Resource types to abort
+        block_trackers: Whether to abort requests to tracker hosts
+    """
+    request = route.request
+    if request.resource_type in blocked or (
+        block_trackers and _TRACKER_RE.match(request.url)
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class UniversalCompanyScraper:
     def __init__(
-        self, base_url: str, headless: bool = False, timeout: int = 30000
+        self,
+        base_url: str,
+        headless: bool = False,
+        timeout: int = 30000,
+        max_concurrency: int = 5,
+        primary_selector: Optional[str] = None,
+        block_resources: Optional[Set[str]] = None,
+        block_trackers: bool = False,
     ):
         """
         Initialize the universal scraper
@@ -34,6 +380,17 @@ class UniversalCompanyScraper:
             base_url: Base URL of the website to scrape
             headless: Whether to run browser in headless mode
             timeout: Default timeout for page operations in milliseconds
+            max_concurrency: Maximum number of company pages scraped at once
+            primary_selector: Selector whose visibility marks a company page
+                as ready for extraction (defaults to the company-specific
+                name selectors)
+            block_resources: Request resource types to abort in the browser
+                (defaults to DEFAULT_BLOCK_RESOURCES: images, fonts, media,
+                text tracks and manifests)
+            block_trackers: Whether to also abort requests to analytics and
+                ad hosts (helpers.tracker_domains); off by default since
+                some sites load their consent manager or content through
+                a tag manager
         """
         self.base_url = base_url
         self.parsed_url = urlparse(base_url)
@@ -42,14 +399,75 @@ class UniversalCompanyScraper:
         )
         self.headless = headless
         self.timeout = timeout
-        self.companies_data = []
+        self.max_concurrency = max(1, max_concurrency)
+        self.block_resources = set(
+            DEFAULT_BLOCK_RESOURCES
+            if block_resources is None
+            else block_resources
+        )
+        self.block_trackers = block_trackers
+        self.primary_selector = primary_selector or ", ".join(
+            helpers.ready_selectors
+        )
+
+        # The part of primary_selector BeautifulSoup can evaluate; static
+        # pages are only accepted without a browser when it matches
+        self._static_ready_css = self._css_only(self.primary_selector)
+
+        # Pooled contexts are replaced after this many borrowings to keep
+        # Chromium's memory from growing over long crawls
+        self.context_rotate_every = 50
+
+        # Per-context flags marking the cookie banner as already handled
+        self._banner_done: Dict[BrowserContext, asyncio.Event] = {}
+
+        # Pooled contexts the cookies of a previous run were restored into
+        self._cookies_restored: Set[BrowserContext] = set()
+
+        # Number of saved companies; the companies themselves live on disk
+        self._company_count = 0
+
+        # Field counts for the stats, rebuilt after new companies are saved
+        self._stats_cache: Optional[collections.Counter] = None
 
         # File paths for saving data
         self.csv_filename = f"{self.domain}_companies.csv"
         self.json_filename = f"{self.domain}_companies.json"
+        self.jsonl_filename = f"{self.domain}_companies.jsonl"
+
+        # Browser cookies kept between runs, written only once a consent
+        # banner has been accepted
+        self.state_filename = f"{self.domain}_state.json"
+        self._saved_cookies = self._load_saved_cookies()
+
+        # CSV and NDJSON files kept open for the whole run, flushed every
+        # N saved companies or every few seconds, whichever comes first
+        self.flush_every = 64
+        self.flush_interval = 2.0
+        self._csv_file = None
+        self._csv_writer = None
+        self._jsonl_file = None
+        self._pending_rows = 0
+
+        # Decided once here rather than on every open of the CSV file
+        csv_path = Path(self.csv_filename)
+        self._csv_needs_header = (
+            not csv_path.exists() or csv_path.stat().st_size == 0
+        )
+        self._last_flush = time.monotonic()
 
-        # Set to track processed companies (to avoid duplicates)
-        self.processed_companies = set()
+        # Serializes saves that run in worker threads
+        self._save_lock = asyncio.Lock()
+
+        # Keys of saved companies; the only structure duplicate checks use,
+        # so each check is a single set lookup
+        self.processed_companies: Set[int] = set()
+
+        # Fingerprints of canonical source URLs of saved companies
+        self._seen_source_fp: Set[int] = set()
+        self._base_origin = self.parsed_url.netloc.lower()
+        self._base_source_key = self._source_key(base_url)
+        self._base_url_key = self._url_key(base_url)
 
         # Load existing data if files exist
         self._load_existing_data()
@@ -57,33 +475,229 @@ class UniversalCompanyScraper:
         # Comprehensive list of social media domains
         self.social_domains = helpers.social_domains
 
+        # Known domains and path patterns folded into one regex so every
+        # link is checked with a single scan
+        self._social_url_re = re.compile(
+            "|".join(
+                [
+                    *map(re.escape, sorted(self.social_domains)),
+                    *helpers.social_patterns,
+                ]
+            )
+        )
+
+        # Social domain alternation for the platform distribution; longer
+        # domains first so the most specific one wins at a position
+        self._social_domain_re = re.compile(
+            "("
+            + "|".join(
+                map(
+                    re.escape,
+                    sorted(self.social_domains, key=len, reverse=True),
+                )
+            )
+            + ")",
+            re.I,
+        )
+        self._domain_to_platform = {
+            domain: domain.split(".")[0] for domain in self.social_domains
+        }
+
+        # Candidate buttons joined into one selector list so a single
+        # locator query finds whichever of them is on the page
+        self._cookie_css = ", ".join(
+            helpers.cookie_selectors + helpers.cookie_fallback_selectors
+        )
+        self._close_css = ", ".join(helpers.close_selectors)
+        self._modal_css = ", ".join(helpers.modal_selectors)
+
     def _load_existing_data(self):
         """
         Load existing data from files to avoid duplicates
         """
         try:
-            # Load from JSON file if it exists
-            if Path(self.json_filename).exists():
-                with open(self.json_filename, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-                    self.companies_data = existing_data
-
-                    # Build set of processed companies for duplicate checking
-                    for company in existing_data:
-                        company_key = self._generate_company_key(company)
-                        self.processed_companies.add(company_key)
-
-                    logger.info(
-                        f"Loaded {len(existing_data)} existing companies from {self.json_filename}"
+            # Migrate a legacy JSON array to the NDJSON stream
+            if (
+                not Path(self.jsonl_filename).exists()
+                and Path(self.json_filename).exists()
+            ):
+                with open(self.json_filename, "rb") as f:
+                    existing_data = _json_loads(f.read())
+                with open(self.jsonl_filename, "wb") as f:
+                    f.writelines(
+                        _json_dumps(company) + b"\n"
+                        for company in existing_data
                     )
+                del existing_data
+
+            if Path(self.jsonl_filename).exists():
+                # Rebuild the count and duplicate-checking sets one line at
+                # a time without keeping the companies in memory
+                for company in self.iter_companies():
+                    self._company_count += 1
+                    self.processed_companies.add(
+                        self._generate_company_key(company)
+                    )
+                    source_key = self._source_key(company.get("source_url"))
+                    if source_key and source_key != self._base_source_key:
+                        self._seen_source_fp.add(_fingerprint(source_key))
+
+                logger.info(
+                    f"Loaded {self._company_count} existing companies from {self.jsonl_filename}"
+                )
             else:
                 logger.info("No existing data file found, starting fresh")
         except Exception as e:
             logger.error(f"Error loading existing data: {str(e)}")
-            self.companies_data = []
+            self._company_count = 0
             self.processed_companies = set()
+            self._seen_source_fp = set()
+
+    def _load_saved_cookies(self) -> List[Dict]:
+        """
+        Load the cookies stored when a previous run accepted the consent
+        banner for this domain
+
+        Returns:
+            List[Dict]: Saved cookies, empty if there is no state file or
+            it doesn't record an accepted banner
+        """
+        try:
+            with open(self.state_filename, "rb") as f:
+                state = _json_loads(f.read())
+            if not state.get("consent_accepted"):
+                return []
+            return state.get("cookies", [])
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Could not load browser state: {str(e)}")
+            return []
+
+    @property
+    def companies_data(self) -> List[Dict]:
+        """
+        All saved companies, read back from the NDJSON file on access
+
+        Returns:
+            List[Dict]: List of company data dictionaries
+        """
+        return list(self.iter_companies())
+
+    def iter_companies(self, start: int = 0) -> Iterator[Dict]:
+        """
+        Iterate over the saved companies without loading them all at once
+
+        Args:
+            start: Number of leading companies to skip without parsing them
+
+        Yields:
+            Dict: Company data dictionary
+        """
+        if self._jsonl_file is not None:
+            self._jsonl_file.flush()
+        try:
+            f = open(self.jsonl_filename, "rb")
+        except FileNotFoundError:
+            return
+
+        with f:
+            lines = (line for line in f if line.strip())
+            for line in itertools.islice(lines, start, None):
+                yield _json_loads(line)
+
+    def _get_csv_writer(self):
+        """
+        Get the CSV writer, opening the file in append mode on first use
+
+        Returns:
+            csv.writer: Writer bound to the open CSV file
+        """
+        if self._csv_writer is None:
+            self._csv_file = open(
+                self.csv_filename,
+                "a",
+                newline="",
+                encoding="utf-8",
+                buffering=1 << 20,
+            )
+            self._csv_writer = csv.writer(self._csv_file)
+
+            # Write header if file is new
+            if self._csv_needs_header:
+                self._csv_writer.writerow(CSV_FIELDNAMES)
+                self._csv_needs_header = False
+
+        return self._csv_writer
+
+    def _append_jsonl(self, company_data: Dict):
+        """
+        Append one company as a line of the NDJSON file
+
+        Args:
+            company_data: Company data dictionary
+        """
+        if self._jsonl_file is None:
+            self._jsonl_file = open(
+                self.jsonl_filename, "ab", buffering=1 << 20
+            )
+        self._jsonl_file.write(_json_dumps(company_data) + b"\n")
+
+    def flush(self):
+        """
+        Flush buffered CSV rows and NDJSON lines to disk
+        """
+        if self._csv_file is not None:
+            self._csv_file.flush()
+        if self._jsonl_file is not None:
+            self._jsonl_file.flush()
+        self._pending_rows = 0
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        """
+        Flush and close the output files (they are reopened on the next save)
+        """
+        self.flush()
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+        if self._jsonl_file is not None:
+            self._jsonl_file.close()
+            self._jsonl_file = None
+
+    def _finalize(self):
+        """
+        Flush the streams and export the data as a pretty JSON array
+
+        The NDJSON file is the incremental store; the JSON array is only
+        produced here for consumers that expect a single document.
+        """
+        self.flush()
+        if self._company_count:
+            self._write_json(self.json_filename)
+
+    def _write_json(self, filename: str):
+        """
+        Write all company data to a JSON file
 
-    def _generate_company_key(self, company_data: Dict) -> str:
+        Args:
+            filename: Path of the JSON file to (over)write
+        """
+        # Streamed one company at a time; each pretty-printed object is
+        # indented one level to nest it in the array
+        with open(filename, "wb") as f:
+            separator = b"[\n  "
+            for company in self.iter_companies():
+                f.write(separator)
+                f.write(
+                    _json_dumps(company, indent=True).replace(b"\n", b"\n  ")
+                )
+                separator = b",\n  "
+            f.write(b"[]\n" if separator == b"[\n  " else b"\n]\n")
+
+    def _generate_company_key(self, company_data: Dict) -> int:
         """
         Generate a unique key for a company to check for duplicates
 
@@ -91,41 +705,29 @@ class UniversalCompanyScraper:
             company_data: Company data dictionary
 
         Returns:
-            str: Unique key for the company
+            int: 64-bit fingerprint of the normalized name and website,
+            or of the name and source_url when there is no website
         """
         try:
-            # Use combination of name, website, and source_url to identify duplicates
+            # A company is identified by its name and its own website; the
+            # page it was found on only stands in when no website is known
             # Handle None values properly
-            name = company_data.get("name") or ""
-            website = company_data.get("website_url") or ""
-            source_url = company_data.get("source_url") or ""
-
-            # Convert to lowercase for comparison
-            name = name.strip().lower() if name else ""
-            website = website.strip().lower() if website else ""
-            source_url = source_url.strip().lower() if source_url else ""
-
-            # Create a composite key
-            key_parts = []
-            if name:
-                key_parts.append(f"name:{name}")
-            if website:
-                key_parts.append(f"website:{website}")
-            if source_url:
-                key_parts.append(f"source:{source_url}")
-
-            # If no meaningful data, use source_url as fallback
-            if not key_parts and source_url:
-                key_parts.append(f"source:{source_url}")
-
-            return "|".join(key_parts)
+            name = (company_data.get("name") or "").strip().lower()
+            url = (
+                company_data.get("website_url")
+                or company_data.get("source_url")
+                or ""
+            )
+            url = url.strip().lower().rstrip("/")
+
+            return _fingerprint(f"{name}\0{url}")
 
         except Exception as e:
             logger.error(
                 f"Error generating company key: {str(e)}, company_data: {company_data}"
             )
             # Return a fallback key
-            return f"fallback:{id(company_data)}"
+            return _fingerprint(f"fallback:{id(company_data)}")
 
     def _is_duplicate_company(self, company_data: Dict) -> bool:
         """
@@ -140,6 +742,91 @@ class UniversalCompanyScraper:
         company_key = self._generate_company_key(company_data)
         return company_key in self.processed_companies
 
+    @staticmethod
+    @functools.lru_cache(maxsize=131072)
+    def _canonical_source_key(
+        url: Optional[str], base_origin: str = ""
+    ) -> str:
+        """
+        Normalize a source URL into the key used for duplicate checks
+
+        Lowercases scheme and host, drops query string and fragment and
+        strips the trailing slash, so URL variants of one page share a key.
+        URLs on the crawled origin are keyed by path only, since that
+        prefix is identical for all of them. Results are memoized since the
+        same URL is checked before and again while saving.
+
+        Args:
+            url: Source URL to normalize
+            base_origin: Lowercased host of the crawled site
+
+        Returns:
+            str: Canonical key (empty string for empty URLs)
+        """
+        if not url:
+            return ""
+
+        parts = urlsplit(url.strip())
+        netloc = parts.netloc.lower()
+        path = parts.path.rstrip("/") or "/"
+        if netloc == base_origin:
+            return path
+        return f"{parts.scheme.lower()}://{netloc}{path}"
+
+    def _source_key(self, url: Optional[str]) -> str:
+        """
+        Canonical duplicate-check key of a source URL for this site
+
+        Args:
+            url: Source URL to normalize
+
+        Returns:
+            str: Canonical key (empty string for empty URLs)
+        """
+        return self._canonical_source_key(url, self._base_origin)
+
+    def _remember_source_url(self, url: Optional[str]) -> None:
+        """
+        Record a saved company's source URL in the seen-fingerprints set
+
+        The listing page itself is never recorded: companies opened as
+        modals all share it as their source URL.
+
+        Args:
+            url: Source URL of the saved company
+        """
+        key = self._source_key(url)
+        if key and key != self._base_source_key:
+            self._seen_source_fp.add(_fingerprint(key))
+
+    def is_source_url_processed(self, url: str) -> bool:
+        """
+        Check if a company with this source URL was already saved
+
+        Args:
+            url: Source URL to check
+
+        Returns:
+            bool: True if the URL (ignoring query, fragment and trailing
+            slash) belongs to an already saved company
+        """
+        key = self._source_key(url)
+        return bool(key) and _fingerprint(key) in self._seen_source_fp
+
+    def are_source_urls_processed(self, urls: Iterable[str]) -> List[bool]:
+        """
+        Batch version of is_source_url_processed
+
+        Args:
+            urls: Source URLs to check
+
+        Returns:
+            List[bool]: One flag per URL, True if it was already saved
+        """
+        seen = self._seen_source_fp
+        keys = map(self._source_key, urls)
+        return [bool(key) and _fingerprint(key) in seen for key in keys]
+
     def _categorize_social_media(
         self, socials_list: Optional[List[str]]
     ) -> Dict[str, str]:
@@ -149,6 +836,24 @@ class UniversalCompanyScraper:
         Args:
             socials_list: List of social media URLs (can be None)
 
+        Returns:
+            Dict: Dictionary with categorized social media links
+        """
+        # Copied so callers can't modify the cached result
+        return dict(self._categorize_socials(tuple(socials_list or ())))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _categorize_socials(socials: Tuple[str, ...]) -> Dict[str, str]:
+        """
+        Split a tuple of social media URLs into platform columns (memoized)
+
+        The CSV row, the stats and the summary all categorize the same
+        socials lists, so repeated calls are cache hits.
+
+        Args:
+            socials: Social media URLs
+
         Returns:
             Dict: Dictionary with categorized social media links
         """
@@ -160,43 +865,16 @@ class UniversalCompanyScraper:
             "other_socials": [],
         }
 
-        if not socials_list:
-            return {
-                **categorized,
-                "other_socials": "",
-            }  # Convert list to string
-
-        for social_url in socials_list:
+        for social_url in socials:
             if not social_url:
                 continue
 
-            url_lower = social_url.lower()
-
-            # Categorize by platform
-            if any(
-                platform in url_lower
-                for platform in ["facebook.com", "fb.com", "fb.me"]
-            ):
-                if not categorized["facebook"]:  # Take first one found
-                    categorized["facebook"] = social_url
-            elif any(
-                platform in url_lower
-                for platform in ["instagram.com", "instagr.am"]
-            ):
-                if not categorized["instagram"]:
-                    categorized["instagram"] = social_url
-            elif any(
-                platform in url_lower
-                for platform in ["linkedin.com", "lnkd.in"]
-            ):
-                if not categorized["linkedin"]:
-                    categorized["linkedin"] = social_url
-            elif any(
-                platform in url_lower
-                for platform in ["twitter.com", "t.co", "x.com"]
-            ):
-                if not categorized["twitter"]:
-                    categorized["twitter"] = social_url
+            # Categorize by platform with a single scan of the URL
+            match = _SOCIAL_BUCKET_RE.search(social_url)
+            if match:
+                platform = SOCIAL_PLATFORMS[match.lastindex - 1]
+                if not categorized[platform]:  # Take first one found
+                    categorized[platform] = social_url
             else:
                 # All other social platforms
                 categorized["other_socials"].append(social_url)
@@ -206,6 +884,46 @@ class UniversalCompanyScraper:
 
         return categorized
 
+    async def _save_company_async(self, company_data: Dict) -> bool:
+        """
+        Save a company without blocking the event loop
+
+        Serialization and file writes run in a worker thread; the lock
+        keeps saves in order so duplicate checks and writes never overlap.
+
+        Args:
+            company_data: Company data dictionary
+
+        Returns:
+            bool: True if company was saved (not a duplicate)
+        """
+        async with self._save_lock:
+            return await asyncio.to_thread(
+                self._save_company_immediately, company_data
+            )
+
+    def _csv_row(self, company_data: Dict) -> Tuple:
+        """
+        Build a CSV row in CSV_FIELDNAMES order
+
+        The socials list is split into the per-platform columns and missing
+        fields become empty strings (csv.writer writes None values as
+        empty strings too).
+
+        Args:
+            company_data: Company data dictionary
+
+        Returns:
+            Tuple: Row values
+        """
+        return _CSV_ROW(
+            {
+                **_CSV_DEFAULTS,
+                **company_data,
+                **self._categorize_social_media(company_data.get("socials")),
+            }
+        )
+
     def _save_company_immediately(self, company_data: Dict) -> bool:
         """
         Save a single company immediately to both CSV and JSON files
@@ -224,6 +942,14 @@ class UniversalCompanyScraper:
                 )
                 return False
 
+            # Check for duplicates by source URL first (single set probe)
+            source_key = self._source_key(company_data.get("source_url"))
+            if source_key and _fingerprint(source_key) in self._seen_source_fp:
+                logger.info(
+                    f"Skipping already processed source URL: {company_data.get('source_url')}"
+                )
+                return False
+
             # Check for duplicates
             if self._is_duplicate_company(company_data):
                 logger.info(
@@ -232,77 +958,32 @@ class UniversalCompanyScraper:
                 return False
 
             # Update company index to be sequential
-            company_data["company_index"] = len(self.companies_data) + 1
+            company_data["company_index"] = self._company_count + 1
 
             # Add to processed set
             company_key = self._generate_company_key(company_data)
             self.processed_companies.add(company_key)
+            self._remember_source_url(company_data.get("source_url"))
 
-            # Add to companies data
-            self.companies_data.append(company_data)
-
-            # Save to JSON immediately
-            with open(self.json_filename, "w", encoding="utf-8") as f:
-                json.dump(self.companies_data, f, indent=2, ensure_ascii=False)
-
-            # Save to CSV immediately with separate social media columns
-            fieldnames = [
-                "company_index",
-                "name",
-                "description",
-                "website_url",
-                "phone",
-                "email",
-                "logo_url",
-                "source_url",
-                "facebook",
-                "instagram",
-                "linkedin",
-                "twitter",
-                "other_socials",
-            ]
-
-            # Check if CSV file exists and has header
-            csv_exists = Path(self.csv_filename).exists()
-
-            with open(
-                self.csv_filename,
-                "a" if csv_exists else "w",
-                newline="",
-                encoding="utf-8",
-            ) as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                # Write header if file is new
-                if not csv_exists:
-                    writer.writeheader()
-
-                # Prepare company data for CSV
-                company_copy = company_data.copy()
-
-                # Categorize social media links
-                socials = company_data.get("socials", [])
-                social_categories = self._categorize_social_media(socials)
-
-                # Add categorized social media to company data
-                company_copy.update(social_categories)
+            self._company_count += 1
+            self._stats_cache = None
 
-                # Remove the original socials field for CSV (keep in JSON)
-                if "socials" in company_copy:
-                    del company_copy["socials"]
+            # Append to NDJSON immediately
+            self._append_jsonl(company_data)
 
-                # Ensure all fields exist and handle None values
-                for field in fieldnames:
-                    if (
-                        field not in company_copy
-                        or company_copy[field] is None
-                    ):
-                        company_copy[field] = ""
+            # Append to CSV with separate social media columns
+            self._get_csv_writer().writerow(self._csv_row(company_data))
 
-                writer.writerow(company_copy)
+            # Flush buffered rows in batches rather than per company
+            self._pending_rows += 1
+            if (
+                self._pending_rows >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
 
             logger.info(
-                f"Saved company: {company_data.get('name', 'Unknown')} (Total: {len(self.companies_data)})"
+                f"Saved company: {company_data.get('name', 'Unknown')} (Total: {self._company_count})"
             )
             return True
 
@@ -325,6 +1006,24 @@ class UniversalCompanyScraper:
         Returns:
             str: Normalized absolute URL
         """
+        return self._normalize_url(url, self.base_url)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def _normalize_url(url: Optional[str], base_url: str) -> Optional[str]:
+        """
+        Resolve a URL against the base URL (memoized)
+
+        The same navigation links show up on every page, so most calls
+        are cache hits.
+
+        Args:
+            url: URL to normalize
+            base_url: URL relative links are resolved against
+
+        Returns:
+            Optional[str]: Normalized absolute URL
+        """
         if not url:
             return None
 
@@ -334,7 +1033,7 @@ class UniversalCompanyScraper:
 
         # Handle relative URLs
         elif url.startswith("/"):
-            return urljoin(self.base_url, url)
+            return urljoin(base_url, url)
 
         # Handle URLs without protocol
         elif not url.startswith(("http://", "https://")):
@@ -342,10 +1041,33 @@ class UniversalCompanyScraper:
             if "." in url and not url.startswith("."):
                 return "https://" + url
             else:
-                return urljoin(self.base_url, url)
+                return urljoin(base_url, url)
 
         return url
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _url_key(url: str) -> Tuple[str, str, str]:
+        """
+        Reduce a URL to its scheme, host and path (memoized)
+
+        Used to tell whether the browser is still on the listing page,
+        which may add a fragment or query string as it is used.
+
+        Args:
+            url: URL to reduce
+
+        Returns:
+            Tuple[str, str, str]: Lowercased scheme and host, and the path
+            without a trailing slash
+        """
+        parts = urlsplit(url)
+        return (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+        )
+
     def is_social_url(self, url: str) -> bool:
         """
         Check if a URL is a social media link
@@ -359,18 +1081,8 @@ class UniversalCompanyScraper:
         if not url:
             return False
 
-        url_lower = url.lower()
-
-        # Check against known social domains
-        for domain in self.social_domains:
-            if domain in url_lower:
-                return True
-
-        for pattern in helpers.social_patterns:
-            if re.search(pattern, url_lower):
-                return True
-
-        return False
+        # Check against known social domains and patterns at once
+        return self._social_url_re.search(url.lower()) is not None
 
     def extract_phone_from_text(self, text: str) -> Optional[str]:
         """
@@ -385,12 +1097,12 @@ class UniversalCompanyScraper:
         if not text:
             return None
 
-        for pattern in helpers.phone_patterns:
-            match = re.search(pattern, text)
+        for pattern in _PHONE_RES:
+            match = pattern.search(text)
             if match:
                 phone = match.group()
                 # Clean up the phone number
-                phone = re.sub(r"[^\d\+\-\s\(\)]", "", phone)
+                phone = phone.translate(_PHONE_STRIP)
                 if len(phone) >= 10:  # Minimum valid phone length
                     return phone.strip()
 
@@ -409,20 +1121,93 @@ class UniversalCompanyScraper:
         if not text:
             return None
 
-        match = re.search(helpers.email_pattern, text)
+        match = _EMAIL_RE.search(text)
         if match:
             return match.group()
         return None
 
-    async def extract_company_details(self, page: Page) -> Dict:
+    @staticmethod
+    def _description_title_overlap(
+        description: str, page_title: Optional[str]
+    ) -> Optional[str]:
         """
-        Extract company details from the company detail page
+        Check whether a description candidate merely repeats the page title
 
         Args:
-            page: Playwright page object
+            description: Stripped description candidate
+            page_title: Stripped page title (can be None)
 
         Returns:
-            Dict: Company data
+            Optional[str]: Reason to skip the description, or None to keep it
+        """
+        if not page_title:
+            return None
+
+        page_title_lower = page_title.lower()
+        description_lower = description.lower()
+
+        # Skip if description is exactly the same as page title
+        if description_lower == page_title_lower:
+            return "exact match with page title"
+
+        # Skip if description is a substantial part of the page title
+        # (more than 70% of description is contained in title)
+        if (
+            len(description) > 20
+            and description_lower in page_title_lower
+            and len(description) / len(page_title) > 0.4
+        ):
+            return "substantial part of page title"
+
+        # Skip if page title is mostly contained in description
+        # (useful for when description contains the full title plus more)
+        words_in_title = set(page_title_lower.split())
+        words_in_desc = set(description_lower.split())
+        if len(words_in_title) > 3:  # Only check if title has enough words
+            common_words = words_in_title.intersection(words_in_desc)
+            if len(common_words) / len(words_in_title) > 0.7:
+                return "contains most page title words"
+
+        return None
+
+    @staticmethod
+    async def _iter_matches(
+        page: Page, matches: Dict, field: str
+    ) -> AsyncIterator[List]:
+        """
+        Yield the matches of each selector of a selector_bundle field in order
+
+        Selectors the in-page DOM API rejected are resolved through a
+        Playwright locator only when the loop actually reaches them.
+
+        Args:
+            page: Playwright page object
+            matches: Result of the bundled _EXTRACT_JS evaluation
+            field: Field of helpers.selector_bundle
+
+        Yields:
+            List: Values read from the matched elements
+        """
+        selectors = helpers.selector_bundle[field]
+        for selector, found in zip(selectors, matches[field]):
+            if found is None:
+                try:
+                    found = await page.locator(selector).evaluate_all(
+                        _READ_MATCHES_JS, [field, selector]
+                    )
+                except Exception:
+                    found = []
+            yield found
+
+    async def extract_company_details(self, page: Page) -> Dict:
+        """
+        Extract company details from the company detail page
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            Dict: Company data
         """
         company_data = {
             "name": None,
@@ -435,283 +1220,110 @@ class UniversalCompanyScraper:
         }
 
         try:
-            # Wait for content to load
-            await asyncio.sleep(1)
+            # Read every selector in one round-trip
+            matches = await page.evaluate(_EXTRACT_JS, helpers.selector_bundle)
 
             # Extract company name
-            for selector in helpers.name_selectors:
-                if await page.locator(selector).count() > 0:
-                    try:
-                        name_text = await page.locator(
-                            selector
-                        ).first.inner_text()
-                        if name_text and len(name_text.strip()) > 1:
-                            company_data["name"] = name_text.strip()
-                            break
-                    except:
-                        continue
+            async for found in self._iter_matches(page, matches, "name"):
+                if found and found[0] and len(found[0].strip()) > 1:
+                    company_data["name"] = found[0].strip()
+                    break
 
             # Extract logo URL
-            for selector in helpers.logo_selectors:
-                if await page.locator(selector).count() > 0:
-                    try:
-                        logo_url = await page.locator(
-                            selector
-                        ).first.get_attribute("src")
-                        if logo_url:
-                            company_data["logo_url"] = self.normalize_url(
-                                logo_url
-                            )
-                            break
-                    except:
-                        continue
+            async for found in self._iter_matches(page, matches, "logo"):
+                if found and found[0]:
+                    company_data["logo_url"] = self.normalize_url(found[0])
+                    break
 
             # Extract page title for comparison
-            page_title = None
-            try:
-                page_title = await page.title()
-                if page_title:
-                    page_title = page_title.strip()
-                print(f"Page Title: {page_title}")
-            except:
-                pass
+            page_title = (matches["title"] or "").strip() or None
+            print(f"Page Title: {page_title}")
 
             # Extract description
-            for selector in helpers.description_selectors:
-                if await page.locator(selector).count() > 0:
-                    try:
-                        if selector.startswith("meta"):
-                            description = await page.locator(
-                                selector
-                            ).first.get_attribute("content")
-                        else:
-                            description = await page.locator(
-                                selector
-                            ).first.inner_text()
-                        if description and len(description.strip()) > 10:
-                            description = description.strip()
-
-                            # Check if description is related to page title
-                            if page_title:
-                                page_title_lower = page_title.lower()
-                                description_lower = description.lower()
-
-                                # Skip if description is exactly the same as page title
-                                if description_lower == page_title_lower:
-                                    print(
-                                        f"Skipping description - exact match with page title"
-                                    )
-                                    continue
-
-                                # Skip if description is a substantial part of the page title
-                                # (more than 70% of description is contained in title)
-                                if (
-                                    len(description) > 20
-                                    and description_lower in page_title_lower
-                                    and len(description) / len(page_title)
-                                    > 0.4
-                                ):
-                                    print(
-                                        f"Skipping description - substantial part of page title"
-                                    )
-                                    continue
-
-                                # Skip if page title is mostly contained in description
-                                # (useful for when description contains the full title plus more)
-                                words_in_title = set(page_title_lower.split())
-                                words_in_desc = set(description_lower.split())
-                                if (
-                                    len(words_in_title) > 3
-                                ):  # Only check if title has enough words
-                                    common_words = words_in_title.intersection(
-                                        words_in_desc
-                                    )
-                                    if (
-                                        len(common_words) / len(words_in_title)
-                                        > 0.7
-                                    ):
-                                        print(
-                                            f"Skipping description - contains most page title words"
-                                        )
-                                        continue
-
-                            company_data["description"] = description
-                            break
-                    except:
-                        continue
-
-            # Extract phone number
-            phone_found = False
-            for selector in helpers.phone_selectors:
-                if (
-                    await page.locator(selector).count() > 0
-                    and not phone_found
-                ):
-                    try:
-                        element = page.locator(selector).first
-
-                        # Try to get from href first
-                        phone_href = await element.get_attribute("href")
-                        if phone_href and phone_href.startswith("tel:"):
-                            company_data["phone"] = phone_href.replace(
-                                "tel:", ""
-                            ).strip()
-                            phone_found = True
-                        else:
-                            # Get from text content
-                            phone_text = await element.inner_text()
-                            extracted_phone = self.extract_phone_from_text(
-                                phone_text
-                            )
-                            if extracted_phone:
-                                company_data["phone"] = extracted_phone
-                                phone_found = True
-                    except:
+            async for found in self._iter_matches(
+                page, matches, "description"
+            ):
+                description = (found[0] or "").strip() if found else ""
+                if len(description) > 10:
+                    # Check if description is related to page title
+                    skip_reason = self._description_title_overlap(
+                        description, page_title
+                    )
+                    if skip_reason:
+                        print(f"Skipping description - {skip_reason}")
                         continue
 
-            # If no phone found in specific selectors, search in contact sections
-            if not phone_found:
-                for selector in helpers.contact_selectors:
-                    if (
-                        await page.locator(selector).count() > 0
-                        and not phone_found
-                    ):
-                        try:
-                            contact_text = await page.locator(
-                                selector
-                            ).first.inner_text()
-                            extracted_phone = self.extract_phone_from_text(
-                                contact_text
-                            )
-                            if extracted_phone:
-                                company_data["phone"] = extracted_phone
-                                phone_found = True
-                                break
-                        except:
-                            continue
+                    company_data["description"] = description
+                    break
 
-            # Extract email
-            email_found = False
-            for selector in helpers.email_selectors:
-                if (
-                    await page.locator(selector).count() > 0
-                    and not email_found
-                ):
-                    try:
-                        element = page.locator(selector).first
-
-                        # Try to get from href first
-                        email_href = await element.get_attribute("href")
-                        if email_href and email_href.startswith("mailto:"):
-                            company_data["email"] = email_href.replace(
-                                "mailto:", ""
-                            ).strip()
-                            email_found = True
-                        else:
-                            # Get from text content
-                            email_text = await element.inner_text()
-                            extracted_email = self.extract_email_from_text(
-                                email_text
-                            )
-                            if extracted_email:
-                                company_data["email"] = extracted_email
-                                email_found = True
-                    except:
+            # Extract phone number and email, falling back to the text of
+            # the contact sections, gathered once for both
+            contact_text = None
+            for field, prefix, extract in (
+                ("phone", "tel:", self.extract_phone_from_text),
+                ("email", "mailto:", self.extract_email_from_text),
+            ):
+                async for found in self._iter_matches(page, matches, field):
+                    if not found:
                         continue
-
-            # If no email found in specific selectors, search in contact sections
-            if not email_found:
-                for selector in helpers.contact_selectors:
-                    if (
-                        await page.locator(selector).count() > 0
-                        and not email_found
-                    ):
-                        try:
-                            contact_text = await page.locator(
-                                selector
-                            ).first.inner_text()
-                            extracted_email = self.extract_email_from_text(
-                                contact_text
-                            )
-                            if extracted_email:
-                                company_data["email"] = extracted_email
-                                email_found = True
-                                break
-                        except:
-                            continue
+                    # Try to get from href first, then from text content
+                    href = found[0]["href"] or ""
+                    if href.startswith(prefix):
+                        value = href.replace(prefix, "").strip()
+                    else:
+                        value = extract(found[0]["text"] or "")
+                    if value:
+                        company_data[field] = value
+                        break
+                else:
+                    if contact_text is None:
+                        contact_text = _CONTACT_TEXT_SEPARATOR.join(
+                            [
+                                found[0] or ""
+                                async for found in self._iter_matches(
+                                    page, matches, "contact"
+                                )
+                                if found
+                            ]
+                        )
+                    company_data[field] = extract(contact_text)
 
             # Extract website URL (non-social)
-            for selector in helpers.website_selectors:
-                if await page.locator(selector).count() > 0:
-                    try:
-                        elements = page.locator(selector)
-                        count = await elements.count()
-                        for i in range(count):
-                            website_url = await elements.nth(i).get_attribute(
-                                "href"
-                            )
-                            if website_url and "expo" not in website_url:
-                                normalized_url = self.normalize_url(
-                                    website_url
-                                )
-                                if normalized_url and not self.is_social_url(
-                                    normalized_url
-                                ):
-                                    # Avoid setting the current page URL as website
-                                    current_url = page.url
-                                    if (
-                                        normalized_url != current_url
-                                        and not current_url.startswith(
-                                            normalized_url
-                                        )
-                                    ):
-                                        company_data["website_url"] = (
-                                            normalized_url
-                                        )
-                                        break
-                        if company_data["website_url"]:
+            current_url = page.url
+            async for found in self._iter_matches(page, matches, "website"):
+                for website_url in found:
+                    if website_url and "expo" not in website_url:
+                        normalized_url = self.normalize_url(website_url)
+                        # Avoid setting the current page URL as website
+                        if (
+                            normalized_url
+                            and not self.is_social_url(normalized_url)
+                            and normalized_url != current_url
+                            and not current_url.startswith(normalized_url)
+                        ):
+                            company_data["website_url"] = normalized_url
                             break
-                    except:
-                        continue
+                if company_data["website_url"]:
+                    break
 
             # Extract ALL social media links
             socials = set()
 
-            # Get all links on the page
-            all_links = page.locator("a[href]")
-            link_count = await all_links.count()
-
-            for i in range(link_count):
-                try:
-                    href = await all_links.nth(i).get_attribute("href")
-                    if href and self.is_social_url(href):
-                        normalized_url = self.normalize_url(href)
-                        if normalized_url:
-                            socials.add(normalized_url)
-                except:
-                    continue
-
-            # Also check for social links in specific containers
-            for selector in helpers.social_container_selectors:
-                if await page.locator(selector).count() > 0:
-                    try:
-                        container_links = page.locator(f"{selector} a[href]")
-                        container_count = await container_links.count()
-                        for j in range(container_count):
-                            href = await container_links.nth(j).get_attribute(
-                                "href"
-                            )
-                            if href and self.is_social_url(href):
-                                normalized_url = self.normalize_url(href)
-                                if normalized_url:
-                                    socials.add(normalized_url)
-                    except:
-                        continue
+            # Get all links on the page in one round-trip; links inside the
+            # social containers are part of this list as well
+            hrefs = await page.eval_on_selector_all(
+                "a[href]", "els => els.map(e => e.getAttribute('href'))"
+            )
+            for href in hrefs:
+                if href and self.is_social_url(href):
+                    normalized_url = self.normalize_url(href)
+                    if normalized_url:
+                        socials.add(normalized_url)
 
             company_data["socials"] = list(socials)
 
             logger.info(
-                f"Extracted company data: {json.dumps(company_data, indent=2)}"
+                f"Extracted company data: {_json_dumps(company_data, indent=True).decode()}"
             )
 
         except Exception as e:
@@ -719,6 +1331,247 @@ class UniversalCompanyScraper:
 
         return company_data
 
+    @staticmethod
+    def _css_only(selector: str) -> Optional[str]:
+        """
+        Drop the Playwright-only parts (e.g. :has-text()) of a selector list
+
+        Args:
+            selector: Comma-separated Playwright selector list
+
+        Returns:
+            Optional[str]: Selector list BeautifulSoup can evaluate, or None
+            if no part of it is plain CSS
+        """
+        try:
+            soupsieve.compile(selector)
+            return selector
+        except Exception:
+            pass
+
+        parts = []
+        for part in selector.split(","):
+            try:
+                soupsieve.compile(part)
+                parts.append(part.strip())
+            except Exception:
+                continue
+        return ", ".join(parts) or None
+
+    def _has_company_content(self, soup: BeautifulSoup) -> bool:
+        """
+        Check if static HTML already contains the company content
+
+        A page shell with only the site's own header and scripts passes
+        _looks_rendered, so the primary selector has to match as well.
+
+        Args:
+            soup: Parsed page HTML
+
+        Returns:
+            bool: True if the CSS part of the primary selector matches
+        """
+        if self._static_ready_css is None:
+            return False
+        return soup.select_one(self._static_ready_css) is not None
+
+    @staticmethod
+    def _looks_rendered(html: str) -> bool:
+        """
+        Heuristically check if raw HTML already contains the page content
+
+        Pages whose body is mostly <script> code are client-side rendered
+        and need a real browser.
+
+        Args:
+            html: Raw HTML of the page
+
+        Returns:
+            bool: True if the HTML can be parsed without JavaScript
+        """
+        if not html:
+            return False
+
+        script_bytes = sum(len(m) for m in _SCRIPT_RE.findall(html))
+        return script_bytes / len(html) <= 0.8
+
+    async def _fetch_static_html(
+        self, client: "httpx.AsyncClient", url: str
+    ) -> Union[str, object, None]:
+        """
+        Fetch a page over plain HTTP if it does not need JavaScript
+
+        Args:
+            client: Shared HTTP client
+            url: Page URL
+
+        Returns:
+            Union[str, object, None]: Page HTML, _RATE_LIMITED if the site
+            answered HTTP 429, or None if a browser is needed
+        """
+        try:
+            response = await client.get(url)
+        except Exception as e:
+            logger.debug(f"Static fetch failed for {url}: {str(e)}")
+            return None
+
+        if response.status_code == 429:
+            return _RATE_LIMITED
+
+        if response.status_code != 200 or "html" not in response.headers.get(
+            "content-type", ""
+        ):
+            return None
+
+        html = response.text
+        return html if self._looks_rendered(html) else None
+
+    def extract_company_details_from_html(
+        self, html: Union[str, BeautifulSoup], url: str
+    ) -> Dict:
+        """
+        Extract company details from static HTML (no browser needed)
+
+        Mirrors extract_company_details; browser-only selectors such as
+        :has-text() are skipped.
+
+        Args:
+            html: Raw HTML of the company detail page, or the page already
+                parsed with BeautifulSoup
+            url: URL the HTML was fetched from
+
+        Returns:
+            Dict: Company data
+        """
+        company_data = {
+            "name": None,
+            "logo_url": None,
+            "description": None,
+            "website_url": None,
+            "phone": None,
+            "email": None,
+            "socials": [],
+        }
+
+        soup = (
+            html
+            if isinstance(html, BeautifulSoup)
+            else BeautifulSoup(html, "html.parser")
+        )
+
+        def select(selector: str) -> List:
+            try:
+                return soup.select(selector)
+            except Exception:
+                return []
+
+        def text_of(element) -> str:
+            return element.get_text("\n", strip=True)
+
+        # Extract company name
+        for selector in helpers.name_selectors:
+            elements = select(selector)
+            if elements:
+                name_text = text_of(elements[0])
+                if len(name_text) > 1:
+                    company_data["name"] = name_text
+                    break
+
+        # Extract logo URL
+        for selector in helpers.logo_selectors:
+            elements = select(selector)
+            if elements and elements[0].get("src"):
+                company_data["logo_url"] = self.normalize_url(
+                    elements[0]["src"]
+                )
+                break
+
+        # Extract description
+        page_title = soup.title.get_text(strip=True) if soup.title else None
+        for selector in helpers.description_selectors:
+            elements = select(selector)
+            if not elements:
+                continue
+            if selector.startswith("meta"):
+                description = (elements[0].get("content") or "").strip()
+            else:
+                description = text_of(elements[0])
+            if len(description) > 10 and not self._description_title_overlap(
+                description, page_title
+            ):
+                company_data["description"] = description
+                break
+
+        # Extract phone number and email, falling back to the text of the
+        # contact sections, gathered once for both
+        contact_text = None
+        for field, selectors, prefix, extract in (
+            (
+                "phone",
+                helpers.phone_selectors,
+                "tel:",
+                self.extract_phone_from_text,
+            ),
+            (
+                "email",
+                helpers.email_selectors,
+                "mailto:",
+                self.extract_email_from_text,
+            ),
+        ):
+            for selector in selectors:
+                elements = select(selector)
+                if not elements:
+                    continue
+                href = elements[0].get("href") or ""
+                if href.startswith(prefix):
+                    value = href.replace(prefix, "").strip()
+                else:
+                    value = extract(text_of(elements[0]))
+                if value:
+                    company_data[field] = value
+                    break
+            else:
+                if contact_text is None:
+                    contact_text = _CONTACT_TEXT_SEPARATOR.join(
+                        text_of(elements[0])
+                        for elements in map(select, helpers.contact_selectors)
+                        if elements
+                    )
+                company_data[field] = extract(contact_text)
+
+        # Extract website URL (non-social)
+        for selector in helpers.website_selectors:
+            for element in select(selector):
+                website_url = element.get("href")
+                if website_url and "expo" not in website_url:
+                    normalized_url = self.normalize_url(website_url)
+                    if (
+                        normalized_url
+                        and not self.is_social_url(normalized_url)
+                        and normalized_url != url
+                        and not url.startswith(normalized_url)
+                    ):
+                        company_data["website_url"] = normalized_url
+                        break
+            if company_data["website_url"]:
+                break
+
+        # Extract ALL social media links
+        socials = set()
+        for element in select("a[href]"):
+            href = element["href"]
+            if self.is_social_url(href):
+                normalized_url = self.normalize_url(href)
+                if normalized_url:
+                    socials.add(normalized_url)
+        company_data["socials"] = list(socials)
+
+        logger.info(
+            f"Extracted company data from static HTML: {_json_dumps(company_data, indent=True).decode()}"
+        )
+        return company_data
+
     async def find_company_links(self, page: Page) -> Optional[List[str]]:
         """
         Find all company/exhibitor links on the listing page
@@ -749,10 +1602,7 @@ class UniversalCompanyScraper:
                             href = await elements.nth(i).get_attribute("href")
                             if href:
                                 # Filter out navigation/utility links
-                                if not any(
-                                    pattern in href.lower()
-                                    for pattern in helpers.skip_patterns
-                                ):
+                                if not _SKIP_RE.search(href):
                                     normalized_url = self.normalize_url(href)
                                     if (
                                         normalized_url
@@ -761,10 +1611,7 @@ class UniversalCompanyScraper:
                                         found_urls.add(normalized_url)
 
                                         # Check if it's likely a detail page
-                                        if any(
-                                            re.search(pattern, normalized_url)
-                                            for pattern in helpers.detail_patterns
-                                        ):
+                                        if _DETAIL_RE.search(normalized_url):
                                             company_urls.append(normalized_url)
                         except:
                             continue
@@ -812,161 +1659,769 @@ class UniversalCompanyScraper:
             # Get initial height
             initial_height = await page.evaluate("document.body.scrollHeight")
 
-            # Try different scroll methods
-            for method in helpers.scroll_methods:
-                await page.evaluate(method)
-                await asyncio.sleep(1)
+            # Scroll to the bottom to trigger infinite scrolling
+            await page.evaluate(
+                "window.scrollTo(0, document.body.scrollHeight)"
+            )
+            await page.keyboard.press("Control+End")
 
-            # Also try keyboard scrolling
-            for _ in range(3):
-                await page.keyboard.press("End")
-                await asyncio.sleep(0.5)
-                await page.keyboard.press("PageDown")
-                await asyncio.sleep(0.5)
+            # Check for "Load More" or "Show More" buttons in one query
+            load_more = (
+                page.locator(", ".join(helpers.load_more_selectors))
+                .filter(visible=True)
+                .first
+            )
+            clicked = False
+            try:
+                if await load_more.is_visible():
+                    await load_more.click()
+                    clicked = True
+                    logger.info("Clicked load more button")
+            except Exception as e:
+                logger.debug(f"Could not click load more button: {str(e)}")
 
-            # Check for "Load More" or "Show More" buttons
-            for selector in helpers.load_more_selectors:
-                try:
-                    if await page.locator(selector).is_visible():
-                        await page.locator(selector).click()
-                        await asyncio.sleep(2)
-                        logger.info(f"Clicked load more button: {selector}")
-                        return True
-                except:
+            # Return as soon as lazy loading grows the page
+            try:
+                await page.wait_for_function(
+                    "(height) => document.body.scrollHeight > height",
+                    arg=initial_height,
+                    timeout=3000,
+                )
+                return True
+            except PlaywrightTimeoutError:
+                return clicked
+
+        except Exception as e:
+            logger.error(f"Error during scrolling: {str(e)}")
+            return False
+
+    @classmethod
+    async def ensure_pool(cls, size: int = 4, headless: bool = True) -> None:
+        """
+        Start the shared browser pool if needed and make sure at least
+        `size` contexts are idle
+
+        The browser is launched once per process and reused by every scrape
+        until shutdown_pool() is called. Sizing by idle contexts lets
+        concurrent scrapes each get their own share of the pool.
+
+        Args:
+            size: Minimum number of idle pooled browser contexts
+            headless: Whether to launch the browser in headless mode
+        """
+        global _PLAYWRIGHT, _BROWSER, _CTX_POOL
+
+        # Serialize launches so concurrent scrapes share one browser
+        async with _POOL_LOCK:
+            if _BROWSER is None:
+                _PLAYWRIGHT = await async_playwright().start()
+                _BROWSER = await _PLAYWRIGHT.chromium.launch(
+                    headless=headless,
+                    args=[
+                        "--no-sandbox",
+                        "--disable-dev-shm-usage",
+                        "--disable-blink-features=AutomationControlled",
+                        "--disable-features=site-per-process,TranslateUI,"
+                        "BackForwardCache",
+                        "--disable-web-security",
+                    ],
+                )
+                _CTX_POOL = asyncio.Queue()
+
+            while _CTX_POOL.qsize() < size:
+                _CTX_POOL.put_nowait(await cls._new_context(_BROWSER))
+
+    @classmethod
+    async def shutdown_pool(cls) -> None:
+        """
+        Close the shared browser pool (contexts, browser and Playwright)
+        """
+        global _PLAYWRIGHT, _BROWSER, _CTX_POOL
+
+        try:
+            if _BROWSER is not None:
+                await _BROWSER.close()
+            if _PLAYWRIGHT is not None:
+                await _PLAYWRIGHT.stop()
+        finally:
+            _PLAYWRIGHT = None
+            _BROWSER = None
+            _CTX_POOL = None
+            _CTX_USES.clear()
+            _CTX_BLOCK.clear()
+            _CTX_BLOCK_TRACKERS.clear()
+
+    @asynccontextmanager
+    async def _pooled_context(self) -> AsyncIterator[BrowserContext]:
+        """
+        Borrow a browser context from the pool for the duration of the block
+
+        Contexts keep their cookies between borrowings so consent and
+        session state carry over to the next page of the crawl. Every
+        context_rotate_every borrowings the context is replaced by a fresh
+        one carrying over its storage state.
+
+        Yields:
+            BrowserContext: Pooled browser context
+        """
+        context = await _CTX_POOL.get()
+        _CTX_BLOCK[context] = self.block_resources
+        if self.block_trackers:
+            _CTX_BLOCK_TRACKERS.add(context)
+        else:
+            _CTX_BLOCK_TRACKERS.discard(context)
+        try:
+            if self._saved_cookies and context not in self._cookies_restored:
+                await self._restore_cookies(context)
+            yield context
+        finally:
+            uses = _CTX_USES.get(context, 0) + 1
+            try:
+                if uses >= self.context_rotate_every:
+                    context = await self._rotate_context(context)
+                    uses = 0
+            except Exception as e:
+                # The old context is still open; keep it and retry the
+                # rotation on its next return rather than shrink the pool
+                logger.warning(
+                    f"Could not rotate pooled browser context: {str(e)}"
+                )
+            finally:
+                _CTX_USES[context] = uses
+                _CTX_POOL.put_nowait(context)
+
+    async def _restore_cookies(self, context: BrowserContext) -> None:
+        """
+        Add the cookies saved by a previous run to a pooled context
+
+        The cookie banner is still checked for on the context's first page:
+        consent tools that keep their state in localStorage show it again.
+
+        Args:
+            context: Browser context to restore the cookies into
+        """
+        self._cookies_restored.add(context)
+        try:
+            await context.add_cookies(self._saved_cookies)
+        except Exception as e:
+            logger.debug(f"Could not restore saved cookies: {str(e)}")
+            self._cookies_restored.discard(context)
+
+    async def _save_state(self, context: BrowserContext) -> None:
+        """
+        Store the context's cookies so the next run starts with them
+
+        Only called once the consent banner was accepted in the context;
+        later runs only restore cookies stored with that flag.
+
+        Args:
+            context: Browser context the banner was accepted in
+        """
+        try:
+            state = await context.storage_state()
+            state["consent_accepted"] = True
+            with open(self.state_filename, "wb") as f:
+                f.write(_json_dumps(state, indent=True))
+        except Exception as e:
+            logger.debug(f"Could not save browser state: {str(e)}")
+
+    async def _rotate_context(self, context: BrowserContext) -> BrowserContext:
+        """
+        Replace a pooled context with a new one that has the same storage state
+
+        The new context is created before the old one is closed, so a
+        failed rotation leaves the old context usable.
+
+        Args:
+            context: Context to close
+
+        Returns:
+            BrowserContext: New browser context
+
+        Raises:
+            Exception: If the new context cannot be created
+        """
+        try:
+            state = await context.storage_state()
+        except Exception as e:
+            logger.debug(f"Could not save context storage state: {str(e)}")
+            state = None
+        new_context = await self._new_context(_BROWSER, storage_state=state)
+
+        _CTX_USES.pop(context, None)
+        _CTX_BLOCK.pop(context, None)
+        _CTX_BLOCK_TRACKERS.discard(context)
+        self._banner_done.pop(context, None)
+        self._cookies_restored.discard(context)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing rotated context: {str(e)}")
+
+        logger.info("Rotated pooled browser context")
+        return new_context
+
+    @asynccontextmanager
+    async def _http_client(
+        self,
+    ) -> AsyncIterator[Optional["httpx.AsyncClient"]]:
+        """
+        Open an HTTP client shared by all static page fetches of a run
+
+        Yields None when httpx is not installed, which disables the
+        static fast path.
+
+        Yields:
+            Optional[httpx.AsyncClient]: Pooled HTTP client
+        """
+        if httpx is None:
+            yield None
+            return
+
+        async with httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            timeout=10,
+            follow_redirects=True,
+        ) as client:
+            yield client
+
+    async def _dismiss_cookie_banner(
+        self, page: Page, timeout: int = 200
+    ) -> bool:
+        """
+        Accept the cookie consent banner if one is visible
+
+        One query over all candidates waits briefly for a banner, so pages
+        without one only cost the short timeout. The selectors are then
+        tried in order of preference; a generic container button is only
+        clicked when it is the banner's single visible button.
+
+        Args:
+            page: Playwright page object
+            timeout: Maximum wait for a consent button in milliseconds
+
+        Returns:
+            bool: True if a consent button was clicked
+        """
+        try:
+            await (
+                page.locator(self._cookie_css)
+                .filter(visible=True)
+                .first.wait_for(state="visible", timeout=timeout)
+            )
+        except Exception:
+            return False
+
+        for selector in (
+            *helpers.cookie_selectors,
+            *helpers.cookie_fallback_selectors,
+        ):
+            button = page.locator(selector).filter(visible=True)
+            try:
+                count = await button.count()
+                if not count or (
+                    count > 1 and selector in helpers.cookie_fallback_selectors
+                ):
                     continue
+                button = button.first
+                await button.click()
+                break
+            except Exception:
+                continue
+        else:
+            return False
+
+        logger.info("Accepted cookie consent")
+        try:
+            await button.wait_for(state="hidden", timeout=2000)
+        except PlaywrightTimeoutError:
+            pass
+        return True
+
+    async def _dismiss_cookie_banner_once(
+        self, context: BrowserContext, page: Page
+    ) -> None:
+        """
+        Handle the cookie banner only on the first page of each context
+
+        Pooled contexts keep their cookies, so once consent is handled
+        in a context the banner check is skipped for its later pages.
+
+        Args:
+            context: Browser context the page belongs to
+            page: Playwright page object
+        """
+        done = self._banner_done.setdefault(context, asyncio.Event())
+        if done.is_set():
+            return
+
+        # Set before awaiting so concurrent pages in the context skip it
+        done.set()
+        if await self._dismiss_cookie_banner(page):
+            await self._save_state(context)
+
+    @staticmethod
+    async def _new_context(
+        browser: Browser, storage_state: Optional[Dict] = None
+    ) -> BrowserContext:
+        """
+        Create a browser context with the scraper's default settings
+
+        Args:
+            browser: Launched Playwright browser
+            storage_state: Cookies and local storage to start from
+
+        Returns:
+            BrowserContext: New browser context
+        """
+        context = await browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=USER_AGENT,
+            ignore_https_errors=True,
+            storage_state=storage_state,
+        )
+
+        # Skip downloading assets that extraction never reads; the types
+        # are looked up per request so they follow the borrowing scraper
+        async def route_request(route: Route) -> None:
+            await _route_request(
+                route,
+                _CTX_BLOCK.get(context, DEFAULT_BLOCK_RESOURCES),
+                context in _CTX_BLOCK_TRACKERS,
+            )
 
-            # Wait for potential lazy loading
-            await asyncio.sleep(2)
+        await context.route("**/*", route_request)
+        return context
 
-            # Check if content height increased
-            new_height = await page.evaluate("document.body.scrollHeight")
-            return new_height > initial_height
+    async def _scrape_company_url(
+        self, url: str, http_client: Optional["httpx.AsyncClient"] = None
+    ) -> Optional[Dict]:
+        """
+        Scrape a single company detail page
+
+        Server-rendered pages are fetched and parsed without a browser;
+        the page is opened in a pooled browser context when the static
+        HTML is script-only, lacks the primary selector's content or
+        yields no company name.
+
+        Args:
+            url: Company detail page URL
+            http_client: Shared HTTP client for the static fast path
+
+        Returns:
+            Optional[Dict]: Company data or None if the page failed or the
+            site is rate limiting
+        """
+        if http_client is not None:
+            html = await self._fetch_static_html(http_client, url)
+            if html is _RATE_LIMITED:
+                logger.warning(f"Rate limited on company page: {url}")
+                return None
+            if html is not None:
+                soup = BeautifulSoup(html, "html.parser")
+                if self._has_company_content(soup):
+                    company_data = self.extract_company_details_from_html(
+                        soup, url
+                    )
+                    if company_data["name"]:
+                        company_data["source_url"] = url
+                        return company_data
+
+        async with self._pooled_context() as context:
+            return await self._scrape_company_page(context, url)
+
+    async def _wait_until_ready(self, page: Page, timeout: int = 8000) -> bool:
+        """
+        Wait until the company content is visible or the network is idle
+
+        The load event is no signal here: pages that fetch their content
+        over XHR fire it before the content exists. Pages whose content
+        doesn't match the primary selector count as ready once the network
+        has settled, which is capped by the same timeout.
+
+        Args:
+            page: Playwright page object (already past DOMContentLoaded)
+            timeout: Maximum wait in milliseconds
+
+        Returns:
+            bool: True if either signal fired before the timeout
+        """
+        return await _first_success(
+            page.wait_for_selector(
+                self.primary_selector, state="visible", timeout=timeout
+            ),
+            page.wait_for_load_state("networkidle", timeout=timeout),
+        )
 
+    async def _wait_for_click_result(
+        self, page: Page, url_before: str, timeout: int = 5000
+    ) -> bool:
+        """
+        Wait until a click on a listing item navigated away or opened a modal
+
+        Args:
+            page: Playwright page object
+            url_before: Page URL before the click
+            timeout: Maximum wait in milliseconds
+
+        Returns:
+            bool: True if either happened before the timeout
+        """
+        return await _first_success(
+            page.wait_for_url(
+                lambda url: url != url_before,
+                wait_until="domcontentloaded",
+                timeout=timeout,
+            ),
+            page.wait_for_selector(
+                self._modal_css, state="visible", timeout=timeout
+            ),
+        )
+
+    async def _scrape_in_new_tab(
+        self,
+        context: BrowserContext,
+        item: ElementHandle,
+        timeout: int = 2000,
+    ) -> Optional[Dict]:
+        """
+        Ctrl+click a listing item and extract the company from the new tab
+
+        The listing page stays loaded, so nothing has to be re-rendered
+        or re-scrolled afterwards.
+
+        Args:
+            context: Browser context of the listing page
+            item: Element handle of the listing item
+            timeout: Maximum wait for the new tab in milliseconds
+
+        Returns:
+            Optional[Dict]: Company data, or None if the click opened no tab
+        """
+        try:
+            async with context.expect_page(timeout=timeout) as new_page_info:
+                await item.click(modifiers=["ControlOrMeta"])
+            new_page = await new_page_info.value
+        except PlaywrightTimeoutError:
+            return None
+
+        try:
+            new_page.set_default_timeout(self.timeout)
+            await self._wait_until_ready(new_page)
+            company_data = await self.extract_company_details(new_page)
+            company_data["source_url"] = new_page.url
+            return company_data
+        finally:
+            await new_page.close()
+
+    async def _close_modal(self, page: Page, timeout: int = 2000) -> bool:
+        """
+        Close an open modal or overlay and wait until it is gone
+
+        Clicks the first close button inside the visible modal that becomes
+        clickable within half a second, and presses Escape if there is
+        none. Broad close selectors such as [class*="close"] would
+        otherwise match elements elsewhere on the page first.
+
+        Args:
+            page: Playwright page object
+            timeout: Maximum wait for the modal to disappear in milliseconds
+
+        Returns:
+            bool: True if no modal is visible anymore
+        """
+        modal = page.locator(self._modal_css).filter(visible=True).first
+        close_button = (
+            modal.locator(self._close_css).filter(visible=True).first
+        )
+        try:
+            await close_button.click(timeout=500)
+        except Exception:
+            await page.keyboard.press("Escape")
+
+        try:
+            await modal.wait_for(state="hidden", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug("Modal is still visible after closing it")
+            return False
+
+    async def _read_listing_cards(
+        self, page: Page, selector: str
+    ) -> List[Optional[Dict]]:
+        """
+        Read the company data shown on the listing cards in one evaluate
+
+        A card only counts when it shows a name and a website, phone or
+        email; the others have to be clicked through.
+
+        Args:
+            page: Playwright page object
+            selector: Selector of the listing items
+
+        Returns:
+            List[Optional[Dict]]: Company data per listing item, None for
+            cards without enough data
+        """
+        try:
+            cards = await page.evaluate(_LISTING_CARDS_JS, selector)
         except Exception as e:
-            logger.error(f"Error during scrolling: {str(e)}")
+            logger.debug(f"Could not read listing cards: {str(e)}")
+            return []
+
+        companies = []
+        for card in cards:
+            website_url = None
+            socials = set()
+            for link in card["links"]:
+                # Links back into the listing site are neither
+                if (
+                    not link.startswith("http")
+                    or self._url_key(link)[1] == self._base_url_key[1]
+                ):
+                    continue
+                if self.is_social_url(link):
+                    socials.add(link)
+                elif website_url is None:
+                    website_url = link
+
+            company_data = {
+                "name": card["name"] or None,
+                "logo_url": self.normalize_url(card["logo"]),
+                "description": card["description"] or None,
+                "website_url": website_url,
+                "phone": card["phone"][4:].strip() or None,
+                "email": card["email"][7:].split("?")[0].strip() or None,
+                "socials": list(socials),
+                "source_url": self.base_url,
+            }
+            if company_data["name"] and (
+                website_url or company_data["phone"] or company_data["email"]
+            ):
+                companies.append(company_data)
+            else:
+                companies.append(None)
+        return companies
+
+    async def _wait_for_more_items(
+        self, page: Page, selector: str, count: int, timeout: int = 3000
+    ) -> bool:
+        """
+        Wait until the listing holds more than `count` items
+
+        Args:
+            page: Playwright page object
+            selector: Selector of the listing items
+            count: Number of items already seen
+            timeout: Maximum wait in milliseconds
+
+        Returns:
+            bool: True if new items appeared before the timeout
+        """
+        try:
+            await page.wait_for_function(
+                "([selector, count]) =>"
+                " document.querySelectorAll(selector).length > count",
+                arg=[selector, count],
+                timeout=timeout,
+            )
+            return True
+        except PlaywrightTimeoutError:
             return False
 
+    async def _wait_for_listing(
+        self, page: Page, selector: str, timeout: int = 5000
+    ) -> None:
+        """
+        Wait until the listing items are back in the DOM
+
+        Args:
+            page: Playwright page object
+            selector: Selector of the listing items
+            timeout: Maximum wait in milliseconds
+        """
+        try:
+            await page.wait_for_selector(
+                selector, state="attached", timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            logger.debug(f"Listing items did not reappear: {selector}")
+
+    async def _scrape_company_page(
+        self, context: BrowserContext, url: str
+    ) -> Optional[Dict]:
+        """
+        Open a company detail page in the given context and extract its data
+
+        Args:
+            context: Browser context to open the page in
+            url: Company detail page URL
+
+        Returns:
+            Optional[Dict]: Company data or None if the page failed
+        """
+        page = await context.new_page()
+        try:
+            page.set_default_timeout(self.timeout)
+
+            # Navigate to company page and wait until its content is ready
+            response = await page.goto(url, wait_until="domcontentloaded")
+            if response is not None and response.status == 429:
+                logger.warning(f"Rate limited on company page: {url}")
+                return None
+            if not await self._wait_until_ready(page):
+                # Extract anyway; the page may just keep the network busy
+                logger.warning(f"Company page did not settle: {url}")
+
+            # Extract company data
+            company_data = await self.extract_company_details(page)
+            company_data["source_url"] = url
+
+            # Accept consent only after extraction, so a stray click can't
+            # navigate away or open a dialog first; the cookie then spares
+            # the context's later pages the banner
+            await self._dismiss_cookie_banner_once(context, page)
+            return company_data
+
+        except Exception as e:
+            logger.error(f"Error processing company ({url}): {str(e)}")
+            return None
+
+        finally:
+            await page.close()
+
     async def scrape_companies(self) -> List[Dict]:
         """
         Main scraping function to extract all company data
 
         Returns:
-            List[Dict]: List of company data dictionaries
+            List[Dict]: Companies saved during this run; those from earlier
+            runs stay on disk (see iter_companies)
         """
-        async with async_playwright() as p:
-            browser: Browser = await p.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-features=site-per-process",
-                    "--disable-web-security",
-                ],
-            )
+        run_start = self._company_count
 
-            try:
-                context: BrowserContext = await browser.new_context(
-                    viewport={"width": 1920, "height": 1080},
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    ignore_https_errors=True,
-                )
+        # One pooled context for the listing page plus one per worker; the
+        # listing context is borrowed right after without yielding to the
+        # event loop, so concurrent scrapes cannot starve each other
+        await self.ensure_pool(self.max_concurrency + 1, self.headless)
 
-                page: Page = await context.new_page()
+        async with self._pooled_context() as context:
+            page: Page = await context.new_page()
+            try:
                 page.set_default_timeout(self.timeout)
 
                 logger.info(f"Navigating to {self.base_url}...")
                 await page.goto(self.base_url)
-                await asyncio.sleep(3)
 
-                # Check if we need to handle cookie consent
-                cookie_selectors = [
-                    'button:has-text("accept")',
-                    'button:has-text("agree")',
-                    'button:has-text("ok")',
-                    '[class*="cookie"] button',
-                    '[id*="cookie"] button',
-                ]
+                # Give client-side rendered listings a moment to fetch their
+                # data, but no longer than the network stays busy
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
 
-                for selector in cookie_selectors:
-                    try:
-                        if await page.locator(selector).is_visible():
-                            await page.locator(selector).first.click()
-                            logger.info("Accepted cookie consent")
-                            await asyncio.sleep(1)
-                            break
-                    except:
-                        continue
+                # Check if we need to handle cookie consent
+                await self._dismiss_cookie_banner_once(context, page)
 
                 # Try to find company links first
                 company_urls = await self.find_company_links(page)
 
                 if company_urls:
-                    # Method 1: Navigate to each company URL
+                    # Method 1: Navigate to each company URL concurrently
+                    pending_urls = [
+                        url
+                        for url, processed in zip(
+                            company_urls,
+                            self.are_source_urls_processed(company_urls),
+                        )
+                        if not processed
+                    ]
                     logger.info(
-                        f"Found {len(company_urls)} company URLs to process"
+                        f"Found {len(company_urls)} company URLs to process "
+                        f"({len(company_urls) - len(pending_urls)} already saved)"
                     )
 
-                    for i, url in enumerate(company_urls, 1):
-                        try:
-                            logger.info(
-                                f"Processing company {i}/{len(company_urls)}: {url}"
-                            )
-
-                            # Navigate to company page
-                            await page.goto(url)
-                            await asyncio.sleep(2)
+                    # A fixed set of workers drains a queue of URLs, so the
+                    # number of tasks stays bounded however long the list is
+                    queue: "asyncio.Queue[Tuple[int, str]]" = asyncio.Queue()
+                    for item in enumerate(pending_urls, 1):
+                        queue.put_nowait(item)
+
+                    # Pages in flight are capped by an adaptive limit: it
+                    # starts at two, grows by one per scraped page and is
+                    # halved whenever a page fails (timeouts and HTTP 429
+                    # end up there), so the crawl settles near the rate the
+                    # site tolerates
+                    workers = min(self.max_concurrency, len(pending_urls))
+                    limit = min(2, workers)
+                    active = 0
+                    slots = asyncio.Condition()
+
+                    async def worker() -> None:
+                        nonlocal active, limit
+                        while True:
+                            try:
+                                index, url = queue.get_nowait()
+                            except asyncio.QueueEmpty:
+                                return
+
+                            async with slots:
+                                await slots.wait_for(lambda: active < limit)
+                                active += 1
 
-                            # Extract company data
-                            company_data = await self.extract_company_details(
-                                page
+                            logger.info(
+                                f"Processing company {index}/{len(pending_urls)}: {url}"
                             )
-                            company_data["source_url"] = url
+                            # One failing URL must not stop the worker and,
+                            # through gather, the whole run
+                            company_data = None
+                            try:
+                                company_data = await self._scrape_company_url(
+                                    url, http_client
+                                )
+                            except Exception as e:
+                                logger.error(
+                                    f"Error processing company ({url}): {str(e)}"
+                                )
+                            finally:
+                                async with slots:
+                                    active -= 1
+                                    if company_data:
+                                        limit = min(workers, limit + 1)
+                                    elif limit > 1:
+                                        limit //= 2
+                                        logger.info(
+                                            f"Page failed, lowering concurrency to {limit}"
+                                        )
+                                    slots.notify_all()
 
-                            # Save company immediately and check for duplicates
-                            self._save_company_immediately(company_data)
+                            if company_data:
+                                await self._save_company_async(company_data)
 
-                        except Exception as e:
-                            logger.error(
-                                f"Error processing company {i} ({url}): {str(e)}"
-                            )
-                            continue
+                    async with self._http_client() as http_client:
+                        await asyncio.gather(
+                            *(worker() for _ in range(workers))
+                        )
 
                 else:
                     # Method 2: Click-based navigation (for dynamic sites)
                     logger.info("Using click-based navigation method")
 
-                    # Find clickable company items
-                    item_selectors = [
-                        ".company-item",
-                        ".exhibitor-item",
-                        ".vendor-item",
-                        ".supplier-item",
-                        ".company-card",
-                        ".exhibitor-card",
-                        ".list-item",
-                        ".grid-item",
-                        ".result-item",
-                        ".listing-item",
-                        '[class*="company"]',
-                        '[class*="exhibitor"]',
-                        '[class*="item"]',
-                        '[class*="card"]',
-                        "article",
-                        ".entry",
-                        ".result",
-                    ]
-
+                    # Find clickable company items, counting every
+                    # candidate selector in one evaluate call
                     company_elements = None
                     used_selector = None
 
-                    for selector in item_selectors:
-                        elements = page.locator(selector)
-                        count = await elements.count()
+                    counts = await page.evaluate(
+                        _COUNT_MATCHES_JS, helpers.clickable_item_selectors
+                    )
+                    for selector, count in zip(
+                        helpers.clickable_item_selectors, counts
+                    ):
                         if (
                             count >= 3
                         ):  # At least 3 items to be considered a list
-                            company_elements = elements
+                            company_elements = page.locator(selector)
                             used_selector = selector
                             logger.info(
                                 f"Found {count} company items with selector: {selector}"
@@ -975,14 +2430,21 @@ class UniversalCompanyScraper:
 
                     if company_elements:
                         processed_count = 0
+                        open_in_tab = True
                         scroll_attempts = 0
-                        max_scroll_attempts = 4
+                        max_scroll_attempts = 2
 
                         while scroll_attempts < max_scroll_attempts:
-                            # Re-locate elements after scrolling
+                            # Resolve the items once per scroll round
                             if used_selector is not None:
                                 company_elements = page.locator(used_selector)
-                                current_count = await company_elements.count()
+                                handles = (
+                                    await company_elements.element_handles()
+                                )
+                                current_count = len(handles)
+                                cards = await self._read_listing_cards(
+                                    page, used_selector
+                                )
                             else:
                                 logger.error(
                                     "No valid selector found for company elements."
@@ -991,19 +2453,76 @@ class UniversalCompanyScraper:
 
                             # Process new items
                             for i in range(processed_count, current_count):
+                                url_before = page.url
                                 try:
                                     logger.info(
                                         f"Processing company {i + 1}/{current_count}"
                                     )
 
+                                    # Cards that already show the company's
+                                    # details are saved without a click
+                                    if i < len(cards) and cards[i]:
+                                        await self._save_company_async(
+                                            cards[i]
+                                        )
+                                        continue
+
+                                    # Navigating away and back re-renders
+                                    # the listing and detaches the handles
+                                    if handles is None:
+                                        handles = (
+                                            await company_elements.element_handles()
+                                        )
+                                    if i >= len(handles):
+                                        break
+
+                                    item = handles[i]
+                                    await item.scroll_into_view_if_needed()
+
+                                    # Items that are links open in a new tab;
+                                    # if the first one doesn't, the rest of
+                                    # the listing uses plain clicks
+                                    clicked = False
+                                    if open_in_tab:
+                                        company_data = (
+                                            await self._scrape_in_new_tab(
+                                                context, item
+                                            )
+                                        )
+                                        if company_data is not None:
+                                            # Save company immediately and check for duplicates
+                                            await self._save_company_async(
+                                                company_data
+                                            )
+                                            continue
+
+                                        # The Ctrl+click may still have
+                                        # navigated or opened a modal
+                                        open_in_tab = False
+                                        clicked = (
+                                            await self._wait_for_click_result(
+                                                page, url_before, timeout=1000
+                                            )
+                                        )
+
                                     # Click on the item
-                                    await company_elements.nth(i).click()
-                                    await asyncio.sleep(2)
+                                    if not clicked:
+                                        await item.click()
+                                        await self._wait_for_click_result(
+                                            page, url_before
+                                        )
 
                                     # Check if we navigated to a new page or opened a modal
                                     current_url = page.url
-                                    if current_url != self.base_url:
-                                        # We navigated to a new page
+                                    if current_url != url_before:
+                                        # We navigated to a new page or
+                                        # route; only a new path is a
+                                        # page load to wait for
+                                        if (
+                                            self._url_key(current_url)
+                                            != self._base_url_key
+                                        ):
+                                            await self._wait_until_ready(page)
                                         company_data = (
                                             await self.extract_company_details(
                                                 page
@@ -1014,15 +2533,23 @@ class UniversalCompanyScraper:
                                         )
 
                                         # Save company immediately and check for duplicates
-                                        self._save_company_immediately(
+                                        await self._save_company_async(
                                             company_data
                                         )
 
                                         # Go back
-                                        await page.go_back()
-                                        await asyncio.sleep(2)
+                                        await page.go_back(
+                                            wait_until="domcontentloaded"
+                                        )
+                                        await self._wait_for_listing(
+                                            page, used_selector
+                                        )
+                                        handles = None
                                     else:
-                                        # Might be a modal or overlay
+                                        # Might be a modal or overlay; its
+                                        # container can show before the
+                                        # company content does
+                                        await self._wait_until_ready(page)
                                         company_data = (
                                             await self.extract_company_details(
                                                 page
@@ -1033,38 +2560,12 @@ class UniversalCompanyScraper:
                                         )
 
                                         # Save company immediately and check for duplicates
-                                        self._save_company_immediately(
+                                        await self._save_company_async(
                                             company_data
                                         )
 
-                                        # Try to close modal/overlay
-                                        close_selectors = [
-                                            'button[aria-label="Close"]',
-                                            "button:has(.close)",
-                                            ".close-button",
-                                            ".close",
-                                            '[class*="close"]',
-                                            "button.modal-close",
-                                            ".overlay-close",
-                                            ".dialog-close",
-                                        ]
-
-                                        for close_sel in close_selectors:
-                                            try:
-                                                if await page.locator(
-                                                    close_sel
-                                                ).is_visible():
-                                                    await page.locator(
-                                                        close_sel
-                                                    ).click()
-                                                    await asyncio.sleep(1)
-                                                    break
-                                            except:
-                                                continue
-
-                                        # If no close button, try ESC key
-                                        await page.keyboard.press("Escape")
-                                        await asyncio.sleep(1)
+                                        # Close the modal/overlay
+                                        await self._close_modal(page)
 
                                 except Exception as e:
                                     logger.error(
@@ -1072,17 +2573,29 @@ class UniversalCompanyScraper:
                                     )
                                     # Try to recover
                                     try:
-                                        if page.url != self.base_url:
-                                            await page.goto(self.base_url)
-                                            await asyncio.sleep(2)
+                                        if page.url != url_before:
+                                            await page.goto(
+                                                self.base_url,
+                                                wait_until="domcontentloaded",
+                                            )
+                                            await self._wait_for_listing(
+                                                page, used_selector
+                                            )
                                     except:
                                         pass
+                                    handles = None
                                     continue
 
                             processed_count = current_count
 
-                            # Try to load more content
-                            if not await self.scroll_and_load_more(page):
+                            # Try to load more content; a round only
+                            # counts once new items are in the listing
+                            loaded = await self.scroll_and_load_more(page)
+                            if loaded:
+                                loaded = await self._wait_for_more_items(
+                                    page, used_selector, processed_count
+                                )
+                            if not loaded:
                                 scroll_attempts += 1
                                 if scroll_attempts >= max_scroll_attempts:
                                     logger.info("No more content to load")
@@ -1092,8 +2605,6 @@ class UniversalCompanyScraper:
                                     0  # Reset if new content loaded
                                 )
 
-                            await asyncio.sleep(2)
-
                     else:
                         # Method 3: Extract all data from the current page
                         logger.info("Extracting data from current page")
@@ -1101,147 +2612,113 @@ class UniversalCompanyScraper:
                         company_data["source_url"] = self.base_url
 
                         # Save company immediately and check for duplicates
-                        self._save_company_immediately(company_data)
+                        await self._save_company_async(company_data)
 
             finally:
-                await browser.close()
+                await page.close()
 
         logger.info(
-            f"Scraping completed. Extracted data for {len(self.companies_data)} companies"
+            f"Scraping completed. Extracted data for {self._company_count} companies"
         )
-        return self.companies_data
+        return list(self.iter_companies(start=run_start))
 
     def save_to_csv(self, filename: Optional[str] = None):
         """
         Re-export all data to CSV file (companies are already saved incrementally)
-        This method is mainly for creating a fresh export or custom filename
+        This method is mainly for creating an export under a custom filename;
+        for the default file it only flushes the rows written so far
 
         Args:
             filename: Optional custom filename. If not provided, uses domain_companies.csv
         """
-        if not filename:
-            filename = f"{self.domain}_companies.csv"
+        if not filename or filename == self.csv_filename:
+            # Rows are already streamed to the default files, just flush
+            # them and export the JSON array
+            self._finalize()
+            return
 
-        if not self.companies_data:
+        if not self._company_count:
             logger.warning("No data to save")
             return
 
         try:
-            # Prepare CSV data with separate social media columns
-            fieldnames = [
-                "company_index",
-                "name",
-                "description",
-                "website_url",
-                "phone",
-                "email",
-                "logo_url",
-                "source_url",
-                "facebook",
-                "instagram",
-                "linkedin",
-                "twitter",
-                "other_socials",
-            ]
-
-            # Write to CSV
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for company in self.companies_data:
-                    # Prepare company data for CSV
-                    company_copy = company.copy()
-
-                    # Categorize social media links
-                    socials = company.get("socials", [])
-                    social_categories = self._categorize_social_media(socials)
-
-                    # Add categorized social media to company data
-                    company_copy.update(social_categories)
-
-                    # Remove the original socials field for CSV
-                    if "socials" in company_copy:
-                        del company_copy["socials"]
-
-                    # Ensure all fields exist and handle None values
-                    for field in fieldnames:
-                        if (
-                            field not in company_copy
-                            or company_copy[field] is None
-                        ):
-                            company_copy[field] = ""
-
-                    writer.writerow(company_copy)
+            self.flush()
+            if Path(self.csv_filename).exists():
+                # The streamed CSV already holds every row, so copy it
+                # instead of rebuilding the rows from the NDJSON file
+                shutil.copyfile(self.csv_filename, filename)
+            else:
+                # Write to CSV with separate social media columns
+                with open(
+                    filename, "w", newline="", encoding="utf-8"
+                ) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(CSV_FIELDNAMES)
+                    writer.writerows(map(self._csv_row, self.iter_companies()))
 
             logger.info(f"Data re-exported to {filename}")
 
             # Also save as JSON for complete data
             json_filename = filename.replace(".csv", ".json")
-            with open(json_filename, "w", encoding="utf-8") as f:
-                json.dump(self.companies_data, f, indent=2, ensure_ascii=False)
+            self._write_json(json_filename)
             logger.info(f"Complete data also re-exported to {json_filename}")
 
         except Exception as e:
             logger.error(f"Error saving data: {str(e)}")
 
-    def get_scraping_stats(self) -> Dict:
+    def _count_fields(self) -> collections.Counter:
         """
-        Get statistics about the current scraping session
+        Count the companies that have each field and social platform
+
+        All companies are read in a single pass; the result is cached
+        until the next company is saved.
 
         Returns:
-            Dict: Statistics about scraped companies
+            collections.Counter: Companies per field, social category
+            and "total"
         """
-        # Calculate social media statistics
-        facebook_count = 0
-        instagram_count = 0
-        linkedin_count = 0
-        twitter_count = 0
-        other_socials_count = 0
+        if self._stats_cache is not None:
+            return self._stats_cache
 
-        for company in self.companies_data:
-            socials = company.get("socials", [])
+        counts = collections.Counter()
+        for company in self.iter_companies():
+            counts["total"] += 1
+            for field in STATS_FIELDS:
+                if company.get(field):
+                    counts[field] += 1
+
+            socials = company.get("socials")
             if socials:
                 social_categories = self._categorize_social_media(socials)
-                if social_categories["facebook"]:
-                    facebook_count += 1
-                if social_categories["instagram"]:
-                    instagram_count += 1
-                if social_categories["linkedin"]:
-                    linkedin_count += 1
-                if social_categories["twitter"]:
-                    twitter_count += 1
-                if social_categories["other_socials"]:
-                    other_socials_count += 1
+                for platform in (*SOCIAL_PLATFORMS, "other_socials"):
+                    if social_categories[platform]:
+                        counts[platform] += 1
+
+        self._stats_cache = counts
+        return counts
 
+    def get_scraping_stats(self) -> Dict:
+        """
+        Get statistics about the current scraping session
+
+        Returns:
+            Dict: Statistics about scraped companies
+        """
+        counts = self._count_fields()
         return {
-            "total_companies": len(self.companies_data),
-            "companies_with_name": sum(
-                1 for c in self.companies_data if c.get("name")
-            ),
-            "companies_with_description": sum(
-                1 for c in self.companies_data if c.get("description")
-            ),
-            "companies_with_website": sum(
-                1 for c in self.companies_data if c.get("website_url")
-            ),
-            "companies_with_phone": sum(
-                1 for c in self.companies_data if c.get("phone")
-            ),
-            "companies_with_email": sum(
-                1 for c in self.companies_data if c.get("email")
-            ),
-            "companies_with_logo": sum(
-                1 for c in self.companies_data if c.get("logo_url")
-            ),
-            "companies_with_socials": sum(
-                1 for c in self.companies_data if c.get("socials")
-            ),
-            "companies_with_facebook": facebook_count,
-            "companies_with_instagram": instagram_count,
-            "companies_with_linkedin": linkedin_count,
-            "companies_with_twitter": twitter_count,
-            "companies_with_other_socials": other_socials_count,
+            "total_companies": counts["total"],
+            "companies_with_name": counts["name"],
+            "companies_with_description": counts["description"],
+            "companies_with_website": counts["website_url"],
+            "companies_with_phone": counts["phone"],
+            "companies_with_email": counts["email"],
+            "companies_with_logo": counts["logo_url"],
+            "companies_with_socials": counts["socials"],
+            "companies_with_facebook": counts["facebook"],
+            "companies_with_instagram": counts["instagram"],
+            "companies_with_linkedin": counts["linkedin"],
+            "companies_with_twitter": counts["twitter"],
+            "companies_with_other_socials": counts["other_socials"],
             "csv_file": self.csv_filename,
             "json_file": self.json_filename,
         }
@@ -1251,18 +2728,31 @@ class UniversalCompanyScraper:
         Clear all scraped data and delete files (use with caution!)
         """
         try:
-            self.companies_data = []
+            self.close()
+            self._company_count = 0
+            self._stats_cache = None
             self.processed_companies = set()
+            self._seen_source_fp = set()
 
             # Delete files if they exist
             if Path(self.csv_filename).exists():
                 Path(self.csv_filename).unlink()
                 logger.info(f"Deleted {self.csv_filename}")
+            self._csv_needs_header = True
 
             if Path(self.json_filename).exists():
                 Path(self.json_filename).unlink()
                 logger.info(f"Deleted {self.json_filename}")
 
+            if Path(self.jsonl_filename).exists():
+                Path(self.jsonl_filename).unlink()
+                logger.info(f"Deleted {self.jsonl_filename}")
+
+            if Path(self.state_filename).exists():
+                Path(self.state_filename).unlink()
+                logger.info(f"Deleted {self.state_filename}")
+            self._saved_cookies = []
+
             logger.info("All data cleared")
 
         except Exception as e:
@@ -1272,60 +2762,40 @@ class UniversalCompanyScraper:
         """
         Print summary statistics of the scraped data
         """
-        if not self.companies_data:
+        counts = self._count_fields()
+        if not counts["total"]:
             print("No data collected")
             return
 
         print(f"\n{'='*60}")
         print(f"SCRAPING SUMMARY FOR {self.domain}")
         print(f"{'='*60}")
-        print(f"Total companies processed: {len(self.companies_data)}")
-        print(
-            f"Companies with name: {sum(1 for c in self.companies_data if c.get('name'))}"
-        )
-        print(
-            f"Companies with description: {sum(1 for c in self.companies_data if c.get('description'))}"
-        )
-        print(
-            f"Companies with website: {sum(1 for c in self.companies_data if c.get('website_url'))}"
-        )
-        print(
-            f"Companies with phone: {sum(1 for c in self.companies_data if c.get('phone'))}"
-        )
-        print(
-            f"Companies with email: {sum(1 for c in self.companies_data if c.get('email'))}"
-        )
-        print(
-            f"Companies with logo: {sum(1 for c in self.companies_data if c.get('logo_url'))}"
-        )
-        print(
-            f"Companies with social media: {sum(1 for c in self.companies_data if c.get('socials'))}"
-        )
+        print(f"Total companies processed: {counts['total']}")
+        print(f"Companies with name: {counts['name']}")
+        print(f"Companies with description: {counts['description']}")
+        print(f"Companies with website: {counts['website_url']}")
+        print(f"Companies with phone: {counts['phone']}")
+        print(f"Companies with email: {counts['email']}")
+        print(f"Companies with logo: {counts['logo_url']}")
+        print(f"Companies with social media: {counts['socials']}")
 
         # Social media platform distribution
-        if self.companies_data:
-            all_social_platforms = {}
-            for company in self.companies_data:
-                for social_url in company.get("socials", []):
+        if counts["socials"]:
+            all_social_platforms = collections.Counter()
+            for company in self.iter_companies():
+                for social_url in company.get("socials") or []:
                     # Extract platform name from URL
-                    social_url_lower = social_url.lower()
-                    for domain in self.social_domains:
-                        if domain in social_url_lower:
-                            platform = domain.split(".")[0]
-                            all_social_platforms[platform] = (
-                                all_social_platforms.get(platform, 0) + 1
-                            )
-                            break
+                    match = self._social_domain_re.search(social_url)
+                    if match:
+                        all_social_platforms[
+                            self._domain_to_platform[match.group(1).lower()]
+                        ] += 1
 
             if all_social_platforms:
                 print(f"\n{'='*60}")
                 print("SOCIAL MEDIA PLATFORMS DISTRIBUTION")
                 print(f"{'='*60}")
-                sorted_platforms = sorted(
-                    all_social_platforms.items(),
-                    key=lambda x: x[1],
-                    reverse=True,
-                )
+                sorted_platforms = all_social_platforms.most_common()
                 for platform, count in sorted_platforms[:10]:  # Show top 10
                     print(f"{platform:20} : {count:4} companies")
                 if len(sorted_platforms) > 10:
@@ -1334,24 +2804,23 @@ class UniversalCompanyScraper:
                     )
 
         # Sample data
-        if self.companies_data:
-            print(f"\n{'='*60}")
-            print("SAMPLE DATA (First 3 companies)")
-            print(f"{'='*60}")
-            for i, company in enumerate(self.companies_data[:3], 1):
-                print(f"\n--- Company {i} ---")
-                for key, value in company.items():
-                    if key == "socials" and value:
-                        print(f"{key}: {len(value)} social links")
-                        for social in value[:3]:  # Show first 3 social links
-                            print(f"  - {social}")
-                        if len(value) > 3:
-                            print(f"  ... and {len(value) - 3} more")
-                    elif key == "description" and value:
-                        # Truncate long descriptions
-                        desc = (
-                            value[:200] + "..." if len(value) > 200 else value
-                        )
-                        print(f"{key}: {desc}")
-                    else:
-                        print(f"{key}: {value}")
+        print(f"\n{'='*60}")
+        print("SAMPLE DATA (First 3 companies)")
+        print(f"{'='*60}")
+        for i, company in enumerate(
+            itertools.islice(self.iter_companies(), 3), 1
+        ):
+            print(f"\n--- Company {i} ---")
+            for key, value in company.items():
+                if key == "socials" and value:
+                    print(f"{key}: {len(value)} social links")
+                    for social in value[:3]:  # Show first 3 social links
+                        print(f"  - {social}")
+                    if len(value) > 3:
+                        print(f"  ... and {len(value) - 3} more")
+                elif key == "description" and value:
+                    # Truncate long descriptions
+                    desc = value[:200] + "..." if len(value) > 200 else value
+                    print(f"{key}: {desc}")
+                else:
+                    print(f"{key}: {value}")